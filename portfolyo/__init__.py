@@ -1,10 +1,15 @@
 """Package to analyse and manipulate timeseries related to power and gas offtake portfolios."""
 
-from . import dev, tools
+from . import dev, settings, tools
 from .core import extendpandas  # extend functionalty of pandas
 from .core import suppresswarnings
 from .core.pfline import Kind, PfLine, Structure, create
+from .core.pfline.stream import Builder as PfLineBuilder
 from .core.pfstate import PfState
+from .core.shared.arrow import from_arrow, read_feather, read_parquet
+from .core.shared.cache import clear_results as clear_result_cache
+from .core.shared.cache import results_info as result_cache_info
+from .core.shared.magnitude import magnitude_mode
 from .tools import testing
 from .tools2.concat import general as concat
 from .tools2.intersect import indexable as intersection
@@ -12,6 +17,7 @@ from .tools2.plot import plot_pfstates
 from .tools.changefreq import averagable as asfreq_avg
 from .tools.changefreq import summable as asfreq_sum
 from .tools.freq import assert_freq_valid
+from .tools.hedge import cascade as hedge_cascade
 from .tools.hedge import hedge
 from .tools.peakfn import PeakFunction
 from .tools.peakfn import factory as create_peakfn
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 
 from ... import tools
+from ..shared import magnitude, validation
 from . import classes, create, interop
 from .enums import Kind, Structure
 
@@ -222,7 +223,10 @@ class Add:
         # newdf = sum(tools.intersect.frames(pfl1.df, pfl2.df))  # keep common rows
         # if pfl1.kind is Kind.COMPLETE:
         #     newdf["p"] = newdf["r"] / newdf["q"]
-        newdfs = tools.intersect.frames(pfl1.df, pfl2.df)  # keep only common rows
+        df1, df2 = pfl1.df, pfl2.df
+        if magnitude.active():
+            df1, df2 = magnitude.magnitudes(df1), magnitude.magnitudes(df2)
+        newdfs = tools.intersect.frames(df1, df2)  # keep only common rows
         newdf = sum(newdfs)
         if len(newdf.index) == 0:
             raise NotImplementedError(
@@ -233,6 +237,8 @@ class Add:
             values = pd.DataFrame({"1": newdfs[0].p, "2": newdfs[1].p})
             weights = pd.DataFrame({"1": newdfs[0].q, "2": newdfs[1].q})
             newdf["p"] = tools.wavg.dataframe(values, weights, axis=1)
+        if magnitude.active():
+            newdf = magnitude.quantify(newdf)
         return pfl1.__class__(newdf)
 
     @Prep.assert_pflines_samekind  # pfl1 and pfl2 now have same kind
@@ -261,9 +267,12 @@ class Multiply:
             )
         q, p = (pfl2.q, pfl1.p) if pfl1.kind is Kind.PRICE else (pfl1.q, pfl2.p)
         q, p = tools.intersect.frames(q, p)
-        r = (q * p).pint.to_base_units()
+        if magnitude.active():  # MWh * Eur/MWh = Eur
+            newdf = magnitude.quantify(pd.DataFrame({"r": q.pint.m * p.pint.m}))
+        else:
+            newdf = pd.DataFrame({"r": (q * p).pint.to_base_units()})
         constructor = classes.constructor(Structure.FLAT, Kind.REVENUE)
-        return constructor(pd.DataFrame({"r": r}))
+        return constructor(newdf)
 
     def pfline_and_series(pfl: PfLine, s: pd.Series) -> PfLine:
         if isinstance(pfl, classes.FlatPfLine):
@@ -272,10 +281,18 @@ class Multiply:
             return Multiply.nestedpfline_and_series(pfl, s)
 
     def flatpfline_and_series(pfl: NestedPfLine, s: pd.Series) -> NestedPfLine:
-        df, s = tools.intersect.frames(pfl.df, s)
+        df = pfl.df
+        if magnitude.active():
+            df, s = (
+                magnitude.magnitudes(df),
+                magnitude.magnitudes(s),
+            )
+        df, s = tools.intersect.frames(df, s)
         newdf = pd.DataFrame({col: series * s for col, series in df.items()})
         if pfl.kind is Kind.COMPLETE:  # correction: in this case, keep original prices
             newdf["p"] = df["p"]
+        if magnitude.active():
+            newdf = magnitude.quantify(newdf)
         return pfl.__class__(newdf)
 
     def nestedpfline_and_series(pfl: NestedPfLine, s: pd.Series) -> NestedPfLine:
@@ -320,7 +337,8 @@ class Divide:
                 "To divide PfLines of unequal kind, the numerator must have revenues,"
                 " and denominator must have volumes or prices."
             )
-        return create.flatpfline(data)
+        with validation.trusted():
+            return create.flatpfline(data)
 
 
 class Unite:
@@ -338,4 +356,5 @@ class Unite:
 
         # Collect the complete dataframe.
         data = pd.concat(tools.intersect.frames(pfl1.df, pfl2.df), axis=1)
-        return create.flatpfline(data)
+        with validation.trusted():
+            return create.flatpfline(data)
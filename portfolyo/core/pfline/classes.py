@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import abc
 import dataclasses
-from typing import Callable, Dict  # noqa
+from typing import Any, Callable, Dict, Iterable  # noqa
 
 import numpy as np
 import pandas as pd
 
 from ... import tools
+from ..shared.arrow import ArrowOutput
 from ..shared.excelclipboard import ExcelClipboardOutput
+from ..shared.pickling import Picklable
+from ..shared import validation
+from ..shared.cache import derived, memoized
 from ..shared.ndframelike import NDFrameLike
-from . import children, create, dataframeexport, flat_methods, nested_methods
+from . import (
+    children,
+    create,
+    dataframeexport,
+    extend,
+    flat_methods,
+    nested_methods,
+    stream,
+)
 from .arithmatic import PfLineArithmatic
 from .enums import Kind, Structure
 from .plot import PfLinePlot
@@ -61,7 +73,13 @@ def series_property_raising_typeerror(what: str) -> Callable[[PfLine], pd.Series
 
 
 class PfLine(
-    NDFrameLike, PfLineText, PfLinePlot, ExcelClipboardOutput, PfLineArithmatic
+    NDFrameLike,
+    PfLineText,
+    PfLinePlot,
+    ExcelClipboardOutput,
+    ArrowOutput,
+    Picklable,
+    PfLineArithmatic,
 ):
     """Class to hold a related energy timeseries. This can be volume data (with q
     [MWh] and w [MW]), price data (with p [Eur/MWh]), revenue data (with r [Eur]), or
@@ -76,9 +94,69 @@ class PfLine(
         # User did indeed call PfLine and data must be processed by a descendent's __init__
         return create.pfline(data)
 
+    @classmethod
+    def from_trusted(cls, data) -> PfLine:
+        """Create portfolio line from data that is known to be standardized and
+        consistent, without verifying this.
+
+        Parameters
+        ----------
+        data : Any
+            Same as for ``PfLine()``.
+
+        Returns
+        -------
+        PfLine
+
+        Notes
+        -----
+        Missing values (e.g. ``w`` if only ``q`` is given) are still calculated. Passing
+        data with e.g. gaps in its index, or inconsistent values for ``r``, ``p`` and
+        ``q``, leads to incorrect results in later calculations.
+        """
+        with validation.trusted():
+            return create.pfline(data)
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable,
+        freq: str = None,
+        asfreq: str = None,
+        periods: int = None,
+    ) -> FlatPfLine:
+        """Create flat portfolio line from consecutive chunks of data, e.g. when reading
+        a large file piece by piece.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.Series | pd.DataFrame]
+            Data, as would be used in ``PfLine()``. The index of each chunk must continue
+            where the index of the previous chunk ended; chunks need not contain full days.
+        freq : str, optional (default: frequency of the first chunk)
+            Frequency of the data in the chunks.
+        asfreq : str, optional (default: None)
+            If specified, only keep the values resampled to this frequency (e.g. 'MS' for
+            month), so that the values at the original frequency are never all in memory.
+        periods : int, optional (default: None)
+            Expected number of timestamps in all chunks together, to allocate memory
+            up-front. Only relevant if ``asfreq`` is not specified.
+
+        Returns
+        -------
+        FlatPfLine
+
+        See also
+        --------
+        portfolyo.PfLineBuilder
+        """
+        return stream.from_chunks(chunks, freq, asfreq, periods)
+
     def __post_init__(self):
         err = f"Expected columns {self.kind.available}, received {self.df.columns}."
         assert set(self.df.columns) == set(self.kind.available), err
+        # Index of (flat) portfolio line is standardized; no need to check it again.
+        tools.standardize.mark_standardized(self.index)
 
     @property
     @abc.abstractmethod
@@ -90,6 +168,13 @@ class PfLine(
     def structure(self) -> Structure:
         ...
 
+    @property
+    @abc.abstractmethod
+    def fingerprint(self) -> str:
+        """Hash of the content (kind, index, values, and names of children). Portfolio
+        lines with the same fingerprint are equal; calculated once per object."""
+        ...
+
     @property
     def index(self) -> pd.DatetimeIndex:
         """Index of the data, containing the left-bound timestamps of the delivery periods."""
@@ -223,6 +308,72 @@ class PfLine(
         """
         ...
 
+    @abc.abstractmethod
+    def hedge_cascade_with(
+        self: PfLine,
+        p: PricePfLine,
+        freqs: Iterable[str] = ("YS", "QS", "MS"),
+        how: str = "val",
+        peak_fn: tools.peakfn.PeakFunction = None,
+    ) -> Dict[str, PfLine]:
+        """Hedge the volume in the portfolio line with a price curve, in several steps.
+        Each step hedges the volume that is left open by the previous steps, with
+        products of a shorter duration.
+
+        Parameters
+        ----------
+        p : PricePfLine
+            Portfolio line with prices to be used in the hedge.
+        freqs : Iterable[str], optional (default: ('YS', 'QS', 'MS'))
+            Frequencies of the hedging products, in the order in which they are bought.
+            Each one of 'D' (days), 'MS' (months), 'QS' (quarters), 'YS' (years).
+        how : str, optional (Default: 'val')
+            Hedge-constraint. 'vol' for volumetric hedge, 'val' for value hedge.
+        peak_fn : PeakFunction, optional (default: None)
+            To hedge with peak and offpeak products: function that returns boolean
+            Series indicating if timestamps in index lie in peak period.
+            If None, hedge with base products. Daily products are always base products.
+
+        See also
+        --------
+        PfLine.hedge_with
+
+        Returns
+        -------
+        Dict[str, PfLine]
+            For each frequency in ``freqs``: the hedged volumes and prices with products
+            of that frequency. Each only contains the full delivery periods of these
+            products. Their sum is the total hedge.
+
+        Notes
+        -----
+        If the PfLine contains prices, these are ignored.
+        """
+        ...
+
+    @abc.abstractmethod
+    def append(self, other: Any) -> PfLine:
+        """Return portfolio line with the data of ``other`` added at the end.
+
+        Parameters
+        ----------
+        other : PfLine | Any
+            Portfolio line (or data to create one) with the same kind, frequency,
+            timezone and, if nested, the same children. Its index must start where the
+            index of this portfolio line ends.
+
+        Returns
+        -------
+        PfLine
+
+        Notes
+        -----
+        Only the join between both portfolio lines is verified. For flat portfolio
+        lines, the values are stored with spare capacity, so that appending (small)
+        portfolio lines repeatedly does not copy all values every time.
+        """
+        ...
+
     @abc.abstractmethod
     def __bool__(self) -> bool:
         """Return True if object (i.e., its children) contains any non-zero data."""
@@ -283,11 +434,14 @@ class FlatPfLine:
 
     dataframe = dataframeexport.Flat.dataframe
     flatten = flat_methods.flatten
+    fingerprint = derived(flat_methods.fingerprint)
     po = flat_methods.po
     hedge_with = flat_methods.hedge_with
+    hedge_cascade_with = flat_methods.hedge_cascade_with
     loc = flat_methods.loc
     slice = flat_methods.slice
     reindex = flat_methods.reindex
+    append = extend.flat
     __getitem__ = flat_methods.__getitem__
     # __bool__ => on child classes
     __eq__ = flat_methods.__eq__
@@ -298,11 +452,14 @@ class NestedPfLine(children.ChildFunctionality):
 
     dataframe = dataframeexport.Nested.dataframe
     flatten = nested_methods.flatten
+    fingerprint = derived(nested_methods.fingerprint)
     po = nested_methods.po
     hedge_with = nested_methods.hedge_with
+    hedge_cascade_with = nested_methods.hedge_cascade_with
     loc = nested_methods.loc
     slice = nested_methods.slice
     reindex = nested_methods.reindex
+    append = extend.nested
     __bool__ = nested_methods.__bool__
     __eq__ = nested_methods.__eq__
 
@@ -313,6 +470,7 @@ class FlatVolumePfLine(FlatPfLine, VolumePfLine, PfLine):
     # Class is only called internally, so expect df to be in correct format. Here: with columns 'w', 'q'.
     df: pd.DataFrame
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> FlatVolumePfLine:
         newdf = tools.changefreq.summable(self.df[["q"]], freq)
         if not len(newdf):
@@ -337,6 +495,7 @@ class NestedVolumePfLine(NestedPfLine, VolumePfLine, PfLine):
         df = sum(child.df for child in self.children.values())
         object.__setattr__(self, "df", df)
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> NestedVolumePfLine:
         newchildren = {name: child.asfreq(freq) for name, child in self.items()}
         return NestedVolumePfLine(newchildren)
@@ -348,6 +507,7 @@ class FlatPricePfLine(FlatPfLine, PricePfLine, PfLine):
     # Class is only called internally, so expect df to be in correct format. Here: with column 'p'.
     df: pd.DataFrame
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> FlatPricePfLine:
         newdf = tools.changefreq.averagable(self.df[["p"]], freq)
         if not len(newdf):
@@ -371,6 +531,7 @@ class NestedPricePfLine(NestedPfLine, PricePfLine, PfLine):
         df = sum(child.df for child in self.children.values())
         object.__setattr__(self, "df", df)
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> NestedPricePfLine:
         newchildren = {name: child.asfreq(freq) for name, child in self.items()}
         return NestedPricePfLine(newchildren)
@@ -382,6 +543,7 @@ class FlatRevenuePfLine(FlatPfLine, RevenuePfLine, PfLine):
     # Class is only called internally, so expect df to be in correct format. Here: with column 'r'.
     df: pd.DataFrame
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> FlatRevenuePfLine:
         newdf = tools.changefreq.summable(self.df[["r"]], freq)
         if not len(newdf):
@@ -405,6 +567,7 @@ class NestedRevenuePfLine(NestedPfLine, RevenuePfLine, PfLine):
         df = sum(child.df for child in self.children.values())
         object.__setattr__(self, "df", df)
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> NestedRevenuePfLine:
         newchildren = {name: child.asfreq(freq) for name, child in self.items()}
         return NestedRevenuePfLine(newchildren)
@@ -428,6 +591,7 @@ class FlatCompletePfLine(FlatPfLine, CompletePfLine, PfLine):
     def revenue(self) -> FlatRevenuePfLine:
         return FlatRevenuePfLine(self.df[["r"]])
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> FlatCompletePfLine:
         newdf = tools.changefreq.summable(self.df[["q", "r"]], freq)
         if not len(newdf):
@@ -479,6 +643,7 @@ class NestedCompletePfLine(NestedPfLine, CompletePfLine, PfLine):
         newchildren = {name: child.revenue for name, child in self.items()}
         return NestedRevenuePfLine(newchildren)
 
+    @memoized
     def asfreq(self, freq: str = "MS") -> NestedCompletePfLine:
         newchildren = {name: child.asfreq(freq) for name, child in self.items()}
         return NestedCompletePfLine(newchildren)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from . import classes, flat_helper, nested_helper
+from . import classes, flat_helper, interop, nested_helper
 from .enums import Kind, Structure  # noqa
 
 if TYPE_CHECKING:
@@ -16,14 +16,19 @@ def pfline(data: Any) -> PfLine:
         return data
 
     # Data must be processed to see, which descendent class we need to return.
+    fns = {"flat": flatpfline, "nested": nestedpfline}
+    if not interop.keys_allow_inop(data):
+        # Flat portfolio line impossible; don't waste time trying it first.
+        fns = {"nested": nestedpfline, "flat": flatpfline}
     errors = {}
-    for name, fn in {"flat": flatpfline, "nested": nestedpfline}.items():
+    for name, fn in fns.items():
         # Try passing data to other creation functions.
         try:
             return fn(data)
         except (ValueError, TypeError, KeyError) as e:
             errors[name] = e
             pass
+    errors = {name: errors[name] for name in ["flat", "nested"]}
     errormsg = "\n".join(f"- {name}: {e.args[0]}" for name, e in errors.items())
     raise ValueError(
         f"Cannot create flat or nested PfLine from the provided data, with the following reasons:\n{errormsg}"
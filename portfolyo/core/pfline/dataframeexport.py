@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Iterable
 import pandas as pd
 
 from ... import tools
+from ..shared import magnitude
 
 if TYPE_CHECKING:
     from .classes import FlatPfLine, NestedPfLine
@@ -14,7 +15,7 @@ class Flat:
     def dataframe(
         self: FlatPfLine,
         cols: Iterable[str] = None,
-        has_units: bool = True,
+        has_units: bool = None,
         *args,
         **kwargs,
     ) -> pd.DataFrame:
@@ -25,7 +26,7 @@ class Flat:
         cols : str, optional (default: all that are available)
             The columns (w, q, p, r) to include in the dataframe.
             Columns that are not available are silently excluded.
-        has_units : bool, optional (default: True)
+        has_units : bool, optional (default: True, or False in magnitude mode)
             - If True, return dataframe with ``pint`` units. (The unit can be extracted
                 as a column level with ``.pint.dequantify()``).
             - If False, return dataframe with float values.
@@ -34,17 +35,19 @@ class Flat:
         -------
         pd.DataFrame
         """
+        if has_units is None:
+            has_units = not magnitude.active()
         cols = cols or "wqpr"  # in case nothing was specified.
         cols = [col for col in cols if col in "wqpr" and col in self.kind.available]
         df = pd.DataFrame({col: self.df[col] for col in cols})
-        return df if has_units else df.pint.m
+        return df if has_units else magnitude.magnitudes(df)
 
 
 class Nested:
     def dataframe(
         self: NestedPfLine,
         cols: Iterable[str] = None,
-        has_units: bool = True,
+        has_units: bool = None,
         *,
         childlevels: int = -1,
         **kwargs,
@@ -56,7 +59,7 @@ class Nested:
         cols : str, optional (default: all that are available)
             The columns (w, q, p, r) to include in the dataframe.
             Columns that are not available are silently excluded.
-        has_units : bool, optional (default: True)
+        has_units : bool, optional (default: True, or False in magnitude mode)
             - If True, return dataframe with ``pint`` units. (The unit can be extracted
                 as a column level with ``.pint.dequantify()``).
             - If False, return dataframe with float values.
@@ -0,0 +1,104 @@
+"""Append portfolio lines to each other, while only verifying where they are joined."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from ... import tools
+from ..shared import validation
+from . import create
+
+if TYPE_CHECKING:
+    from .classes import FlatPfLine, NestedPfLine, PfLine
+
+
+class _Buffer:
+    """Values (one float array per column) and index of a flat portfolio line, with
+    spare capacity at the end. Shared by the portfolio lines that are created by
+    appending to each other; only the longest one can append without copying."""
+
+    def __init__(self, df: pd.DataFrame, capacity: int):
+        self.index = pd.date_range(df.index[0], periods=capacity, freq=df.index.freq)
+        self.units = {col: s.pint.units for col, s in df.items()}
+        self.values = {col: np.empty(capacity) for col in df}
+        self.length = 0
+        self._lock = threading.Lock()
+        self.claim(0, len(df))
+        self.write(0, df)
+
+    def claim(self, length: int, addition: int) -> bool:
+        """Reserve the ``addition`` rows after the first ``length`` rows. Only possible
+        if these are not yet used, and if there is sufficient capacity."""
+        with self._lock:
+            if self.length != length or length + addition > len(self.index):
+                return False
+            self.length += addition
+            return True
+
+    def write(self, start: int, df: pd.DataFrame) -> None:
+        """Write values of ``df`` (with units) into rows starting at ``start``."""
+        for col, s in df.items():
+            values = tools.unit.convert(s, self.units[col]).pint.magnitude
+            self.values[col][start : start + len(df)] = values.to_numpy(dtype=float)
+
+    def frame(self, length: int) -> pd.DataFrame:
+        """Dataframe with the first ``length`` rows; without copying the values."""
+        index = self.index[:length]
+        data = {
+            col: pd.Series(
+                tools.unit.PA_(v[:length], dtype=tools.unit.pinttype(self.units[col])),
+                index,
+            )
+            for col, v in self.values.items()
+        }
+        return pd.DataFrame(data, copy=False)
+
+
+def _prepare(pfl: PfLine, other: Any) -> PfLine:
+    """Turn ``other`` into portfolio line that can be appended to ``pfl``. Only the join
+    is checked; the data of both is assumed to be correct."""
+    other = create.pfline(other)  # new data is verified as usual
+    if other.kind is not pfl.kind:
+        raise TypeError("Not possible to append PfLines of different kinds.")
+    if other.structure is not pfl.structure:
+        raise TypeError("Not possible to append PfLines of different structures.")
+    if other.index.freq != pfl.index.freq:
+        raise TypeError("Not possible to append PfLines of different frequencies.")
+    if str(other.index.tz) != str(pfl.index.tz):
+        raise TypeError("Not possible to append PfLines of different time zones.")
+    end = tools.right.stamp(pfl.index[-1], pfl.index.freq)
+    if other.index[0] != end:
+        raise ValueError(
+            f"PfLine to append must start where the other one ends ({end}); found {other.index[0]}."
+        )
+    # Start-of-day is equal, as ``other`` is standardized and starts at end of ``pfl``.
+    return other
+
+
+def flat(self: FlatPfLine, other: Any) -> FlatPfLine:
+    other = _prepare(self, other)
+    length, addition = len(self.index), len(other.index)
+    buffer = getattr(self, "_buffer", None)  # set if created by appending
+    if buffer is None or not buffer.claim(length, addition):
+        buffer = _Buffer(self.df, 2 * (length + addition))
+        buffer.claim(length, addition)
+    buffer.write(length, other.df)
+    with validation.trusted():
+        newpfl = self.__class__(buffer.frame(length + addition))
+    object.__setattr__(newpfl, "_buffer", buffer)
+    return newpfl
+
+
+def nested(self: NestedPfLine, other: Any) -> NestedPfLine:
+    other = _prepare(self, other)
+    if set(other.children) != set(self.children):
+        raise TypeError("Not possible to append PfLines with different children names.")
+    children: Dict[str, PfLine] = {
+        name: child.append(other.children[name]) for name, child in self.items()
+    }
+    with validation.trusted():
+        return self.__class__(children)
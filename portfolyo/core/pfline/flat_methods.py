@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import builtins
+from typing import TYPE_CHECKING, Any, Dict, Iterable
 
 import pandas as pd
 
 from ... import tools
+from ..shared import fingerprint as fp
+from ..shared.cache import memoized
 from ...tools.peakconvert import tseries2poframe
 from . import classes
 from .enums import Kind
@@ -17,6 +20,7 @@ def flatten(self: FlatPfLine) -> FlatPfLine:
     return self
 
 
+@memoized
 def po(
     self: PfLine, peak_fn: tools.peakfn.PeakFunction, freq: str = "MS"
 ) -> pd.DataFrame:
@@ -45,6 +49,7 @@ def po(
     return pd.DataFrame({k: df.stack() for k, df in df_dict.items()})
 
 
+@memoized
 def hedge_with(
     self: PfLine,
     prices: PricePfLine,
@@ -62,15 +67,48 @@ def hedge_with(
         )
 
     wout, pout = tools.hedge.hedge(self.w, prices.p, how, peak_fn, freq)
+    return _hedge_pfline(wout, pout)
+
+
+def hedge_cascade_with(
+    self: PfLine,
+    prices: PricePfLine,
+    freqs: Iterable[str] = ("YS", "QS", "MS"),
+    how: str = "val",
+    peak_fn: tools.peakfn.PeakFunction = None,
+) -> Dict[str, FlatPfLine]:
+    if self.kind not in [Kind.VOLUME, Kind.COMPLETE]:
+        raise ValueError(
+            "Cannot hedge a PfLine that does not contain volume information."
+        )
+    if self.index.freq not in ["15min", "h", "D"]:
+        raise ValueError(
+            "Can only hedge a PfLine with daily or (quarter)hourly information."
+        )
+
+    layers = tools.hedge.cascade(self.w, prices.p, freqs, how, peak_fn)
+    return {freq: _hedge_pfline(wout, pout) for freq, (wout, pout) in layers.items()}
+
+
+def _hedge_pfline(wout: pd.Series, pout: pd.Series) -> FlatPfLine:
     df = pd.DataFrame({"w": wout, "p": pout})
     df["q"] = df["w"] * tools.duration.index(df.index)
     df["r"] = df["p"] * df["q"]
     return classes.FlatCompletePfLine(df)
 
 
+def fingerprint(self: FlatPfLine) -> str:
+    parts = ["flat", self.kind.value[0], fp.index(self.index)]
+    for col in sorted(self.df.columns):
+        parts.extend([col, fp.series(self.df[col])])
+    return fp.digest(parts)
+
+
 def __eq__(self: FlatPfLine, other: Any) -> bool:
     if not isinstance(other, self.__class__):
         return False
+    if self is other or self.fingerprint == other.fingerprint:
+        return True
     try:
         tools.testing.assert_frame_equal(self.df, other.df, rtol=1e-7)
         return True
@@ -105,6 +143,11 @@ class LocIndexer:
         self.pfl = pfl
 
     def __getitem__(self, arg) -> FlatPfLine:
+        if isinstance(arg, builtins.slice) and arg.step is None:
+            # Contiguous part of (standardized) index; only boundaries need checking.
+            positions = self.pfl.index.slice_indexer(arg.start, arg.stop)
+            return _window(self.pfl, self.pfl.df.iloc[positions])
+
         newdf = self.pfl.df.loc[arg]
         try:
             tools.standardize.assert_frame_standardized(newdf)
@@ -124,17 +167,19 @@ class SliceIndexer:
         self.pfl = pfl
 
     def __getitem__(self, arg) -> FlatPfLine:
-        mask = pd.Index([True] * len(self.pfl.df))
-        if arg.start is not None:
-            mask &= self.pfl.index >= arg.start
-        if arg.stop is not None:
-            mask &= self.pfl.index < arg.stop
+        i = self.pfl.index
+        start = 0 if arg.start is None else i.searchsorted(arg.start, "left")
+        stop = len(i) if arg.stop is None else i.searchsorted(arg.stop, "left")
+        return _window(self.pfl, self.pfl.df.iloc[start:stop])
 
-        newdf = self.pfl.df.loc[mask]
-        try:
-            tools.standardize.assert_frame_standardized(newdf)
-        except AssertionError as e:
-            raise ValueError(
-                "Timeseries not in expected form. See ``portfolyo.standardize()`` for more information."
-            ) from e
-        return self.pfl.__class__(newdf)  # use same (leaf) class
+
+def _window(pfl: FlatPfLine, newdf: pd.DataFrame) -> FlatPfLine:
+    """FlatPfLine of same class as ``pfl`` with dataframe ``newdf``, which contains a
+    contiguous part of the rows of ``pfl.df``."""
+    try:
+        tools.standardize.assert_window_standardized(newdf.index)
+    except AssertionError as e:
+        raise ValueError(
+            "Timeseries not in expected form. See ``portfolyo.standardize()`` for more information."
+        ) from e
+    return pfl.__class__(newdf)  # use same (leaf) class
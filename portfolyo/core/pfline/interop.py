@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 
 from ... import tools
+from ..shared import validation
 from . import classes, create
 
 if TYPE_CHECKING:  # needed to avoid circular imports
@@ -85,7 +86,8 @@ class InOp:
             elif isinstance(val, pd.Series):
                 kwargs[attr] = val.loc[index]
             elif isinstance(val, tools.unit.Q_):
-                kwargs[attr] = pd.Series(val.m, index, dtype=f"pint[{val.units:P}]")
+                dtype = tools.unit.pinttype(val.units)
+                kwargs[attr] = pd.Series(val.m, index, dtype=dtype)
             else:  # float
                 kwargs[attr] = pd.Series(val, index)
         # Return as new InOp instance.
@@ -115,12 +117,13 @@ class InOp:
 
         # Volumes.
         if w is not None and q is not None:
-            try:
-                tools.testing.assert_series_equal(
-                    w, q / q.index.duration, check_names=False
-                )
-            except AssertionError as e:
-                raise ValueError("Values for w and q are not consistent.") from e
+            if validation.checks_consistency():
+                try:
+                    tools.testing.assert_series_equal(
+                        w, q / q.index.duration, check_names=False
+                    )
+                except AssertionError as e:
+                    raise ValueError("Values for w and q are not consistent.") from e
         elif w is not None and q is None:
             q = w * w.index.duration
         elif w is None and q is not None:
@@ -151,7 +154,12 @@ class InOp:
         # It may be inconsistent with w, q and p.
 
         # Consistency.
-        if q is not None and p is not None and r is not None:
+        if (
+            q is not None
+            and p is not None
+            and r is not None
+            and validation.checks_consistency()
+        ):
             # Check for consistency, but ignore edge cases:
             # - p unknown (nan or inf) and q==0 --> ignore
             # - q unknown (nan or inf) and p==0 --> ignore
@@ -253,7 +261,7 @@ def _set_unit(
             return tools.unit.Q_(v, unit)  # convert to unit
         if isinstance(v, pd.Series) and isinstance(v.index, pd.DatetimeIndex):
             v = _timeseries_of_floats_or_pint(v)  # float-series or pint-series
-            return v.astype(f"pint[{unit:P}]")
+            return tools.unit.convert(v, unit)
         raise TypeError(
             f"Value should be a number, Quantity, or timeseries; got {type(v)}."
         )
@@ -278,14 +286,15 @@ def _timeseries_of_floats_or_pint(s: pd.Series) -> pd.Series:
         # object -> maybe series of Quantitis -> convert to pint-series.
         if not all(isinstance(val, tools.unit.Q_) for val in s.values):
             raise TypeError(f"Timeseries with unexpected data type: {s.dtype}.")
-        quantities = [val.to_base_units() for val in s.values]
-        magnitudes = [q.m for q in quantities]
-        units = list(set([q.u for q in quantities]))
+        magnitudes, units = tools.unit.convert_quantities(s.values)
         if len(units) != 1:
+            units = [f"{u}" for u in units]
             raise ValueError(f"Timeseries needs uniform unit; found {','.join(units)}.")
-        s = pd.Series(magnitudes, s.index, dtype=f"pint[{units[0]:P}]")
+        s = pd.Series(magnitudes, s.index, dtype=tools.unit.pinttype(units[0]))
 
     # Check if all OK.
+    if not validation.checks_index():
+        return s
 
     try:
         tools.standardize.assert_frame_standardized(s)
@@ -334,20 +343,9 @@ def _from_data(
         or isinstance(data, pd.Series)
         or isinstance(data, Mapping)
     ):
-
-        def dimabbr(key):  # following keys return 'w': 'w', ('w', 'pf1'), ('pf1', 'w')
-            if key in _ATTRIBUTES:
-                return key
-            elif not isinstance(key, str) and isinstance(key, Iterable):
-                if (da := dimabbr(key[0])) is not None:
-                    return da
-                if (da := dimabbr(key[-1])) is not None:
-                    return da
-            return None
-
         inops = []
         for key, value in data.items():
-            if da := dimabbr(key):
+            if da := _dimabbr(key):
                 inops.append(InOp(**{da: value}))
             else:
                 raise KeyError(
@@ -363,6 +361,37 @@ def _from_data(
     )
 
 
+def _dimabbr(key: Any) -> str | None:
+    """Attribute a key refers to. The following keys return 'w': 'w', ('w', 'pf1'),
+    ('pf1', 'w')."""
+    if key in _ATTRIBUTES:
+        return key
+    elif not isinstance(key, str) and isinstance(key, Iterable):
+        if (da := _dimabbr(key[0])) is not None:
+            return da
+        if (da := _dimabbr(key[-1])) is not None:
+            return da
+    return None
+
+
+def keys_allow_inop(data: Any) -> bool:
+    """Quick check on the keys of ``data``, without looking at its values. Returns False
+    if ``InOp.from_data(data)`` is certain to fail because a key does not refer to an
+    attribute, or because several keys refer to the same attribute."""
+    if not isinstance(data, pd.DataFrame) and not isinstance(data, Mapping):
+        return True
+    found = set()
+    for key in data.keys():
+        if (da := _dimabbr(key)) is None:
+            return False
+        if isinstance(data, Mapping) and data[key] is None:
+            continue  # None values do not clash
+        if da in found:
+            return False
+        found.add(da)
+    return True
+
+
 def _multiple_union(inops: Iterable[InOp]) -> InOp:
     inop_result = None
     for inop in inops:
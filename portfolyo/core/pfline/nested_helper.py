@@ -3,22 +3,135 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any, Dict, Mapping, Tuple
+from typing import Any, Dict, Iterable, Mapping, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ... import tools
+from ..shared import validation
 from . import classes, create
-from .enums import Kind
+from .enums import Kind, Structure
 
 
 def children_and_kind(data: Any) -> Tuple[Dict[str, classes.PfLine], Kind]:
-    mapping = _mapping(data)
-    children = _children(mapping)
+    if (children := _children_from_wide(data)) is None:
+        mapping = _mapping(data)
+        children = _children(mapping)
     kind = _kind(children)
     return children, kind
 
 
+def _children_from_wide(data: Any) -> Dict[str, classes.PfLine] | None:
+    """From dataframe with 2 column levels (child name, and one of 'w', 'q', 'p', 'r'),
+    where each child has the same columns with float values, create all children in
+    one go. Returns None if ``data`` is not of this form."""
+    if not isinstance(data, pd.DataFrame) or data.columns.nlevels != 2:
+        return None
+    names = list(data.columns.get_level_values(0).unique())
+    attrs = list(data.columns.get_level_values(1).unique())
+    if not names or not set(attrs) <= set("wqpr"):
+        return None
+    if len(data.columns) != len(names) * len(attrs) or data.columns.has_duplicates:
+        return None  # not every child has the same columns
+    if not all(pd.api.types.is_float_dtype(dtype) for dtype in data.dtypes):
+        return None  # e.g. with pint units, or integer values
+    _assert_names(names)
+
+    # Shared index: check once.
+    index = data.index
+    if validation.checks_index():
+        try:
+            tools.standardize.assert_index_standardized(index)
+        except AssertionError as e:
+            raise ValueError(
+                "Timeseries not in expected form. See ``portfolyo.standardize()`` for more information."
+            ) from e
+
+    # Values: 2D arrays (timestamps x children), in default units.
+    columns = pd.MultiIndex.from_product([names, attrs])
+    values = data[columns].to_numpy(dtype=float)
+    blocks = {a: values[:, c :: len(attrs)] for c, a in enumerate(attrs)}
+    hours = tools.duration.index(index).pint.m_as("h").to_numpy(dtype=float)
+    blocks = _consistent_blocks(blocks, hours)
+
+    # Create children.
+    dtypes = {a: tools.unit.pinttype(tools.unit.from_name(a)) for a in blocks}
+    kind = _kind_from_columns(blocks)
+    constructor = classes.constructor(Structure.FLAT, kind)
+    children = {}
+    for j, name in enumerate(names):
+        df = pd.DataFrame(
+            {a: pd.Series(b[:, j], index, dtype=dtypes[a]) for a, b in blocks.items()}
+        )
+        children[name] = constructor(df)
+    return children
+
+
+def _allclose(left: np.ndarray, right: np.ndarray) -> bool:
+    """Same tolerances as ``tools.testing.assert_series_equal``; inf is treated as NaN."""
+    left = np.where(np.isinf(left), np.nan, left)
+    right = np.where(np.isinf(right), np.nan, right)
+    return np.allclose(left, right, rtol=1e-5, atol=1e-8, equal_nan=True)
+
+
+def _consistent_blocks(
+    blocks: Dict[str, np.ndarray], hours: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Fill as much of the data as possible. Vectorized equivalent of
+    ``InOp.make_consistent`` for 2D arrays (timestamps x children) with values in the
+    default units, and ``hours`` the duration of each timestamp."""
+    w, q, p, r = (blocks.get(attr) for attr in "wqpr")
+    h = hours[:, np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Volumes.
+        if w is not None and q is not None:
+            if validation.checks_consistency() and not _allclose(w, q / h):
+                raise ValueError("Values for w and q are not consistent.")
+        elif w is not None and q is None:
+            q = w * h
+        elif w is None and q is not None:
+            w = q / h
+        elif w is None and q is None and p is not None and r is not None:
+            q = r / p
+            w = q / h
+
+        # Price.
+        if p is None and q is not None and r is not None:
+            p = r / q
+
+        # Revenue.
+        if r is None and q is not None and p is not None:
+            r = q * p
+            # Make correction for edge case: p unknown (nan or inf) and q==0 --> assume r=0
+            r[np.isclose(q, 0) & (np.isnan(p) | np.isinf(p))] = 0
+
+        # Consistency.
+        if (
+            q is not None
+            and p is not None
+            and r is not None
+            and validation.checks_consistency()
+        ):
+            ign1 = np.isclose(q, 0) & (np.isnan(p) | np.isinf(p))
+            ign2 = np.isclose(p, 0) & (np.isnan(q) | np.isinf(q))
+            ok = ~(ign1 | ign2)
+            if not _allclose(r[ok], p[ok] * q[ok]):
+                raise ValueError("Values for r, p, and q are not consistent.")
+
+    return {a: v for a, v in zip("wqpr", (w, q, p, r)) if v is not None}
+
+
+def _kind_from_columns(columns: Iterable[str]) -> Kind:
+    """Kind of data, based on the columns that are present."""
+    found = set(columns)
+    for kind in Kind:
+        if set(kind.available) == found:
+            return kind
+    raise ValueError(f"Unexpected columns: {found}.")
+
+
 def _mapping(data: Any) -> Mapping[Any, Any]:
     """From data, create a mapping."""
 
@@ -44,23 +157,30 @@ def _children(mapping: Mapping) -> Dict[str, classes.PfLine]:
     children = {name: create.pfline(child) for name, child in mapping.items()}
 
     # Assert valid keys.
-    for name in children:
-        if not isinstance(name, str):
-            raise TypeError(f"Name must be string; got {name} ({type(name)}).")
-        elif name in ["w", "q", "p", "r"]:
-            raise ValueError("Name cannot be one of 'w', 'q', 'p', 'r'.")
+    _assert_names(children)
 
     # Assert number of children.
     if len(children) == 0:
         raise ValueError("Must provide at least 1 child.")
 
     # Keep only overlapping part of indices.
+    if not validation.checks_index():
+        return children
     idx = tools.intersect.indices(*[child.index for child in children.values()])
     if len(idx) == 0:
         raise ValueError("PfLine indices have no overlap.")
     return {name: child.loc[idx] for name, child in children.items()}
 
 
+def _assert_names(names: Iterable[Any]) -> None:
+    """Raise error if not all names are valid names for children."""
+    for name in names:
+        if not isinstance(name, str):
+            raise TypeError(f"Name must be string; got {name} ({type(name)}).")
+        elif name in ["w", "q", "p", "r"]:
+            raise ValueError("Name cannot be one of 'w', 'q', 'p', 'r'.")
+
+
 def _kind(children: Dict[str, classes.PfLine]) -> Kind:
     """Kind of data, based on children."""
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, Iterable
 
 import pandas as pd
 
 from ... import tools
+from ..shared import fingerprint as fp
+from ..shared.cache import memoized
 from . import classes
 from .enums import Structure
 
@@ -17,12 +19,14 @@ def flatten(self: NestedPfLine) -> FlatPfLine:
     return constructor(self.df)  # use flattened toplevel dataframe for initialisation
 
 
+@memoized
 def po(
     self: NestedPfLine, peak_fn: tools.peakfn.PeakFunction, freq: str = "MS"
 ) -> pd.DataFrame:
     return self.flatten().po(peak_fn, freq)
 
 
+@memoized
 def hedge_with(
     self: NestedPfLine,
     p: PricePfLine,
@@ -33,14 +37,33 @@ def hedge_with(
     return self.flatten().hedge_with(p, how, peak_fn, freq)
 
 
+def hedge_cascade_with(
+    self: NestedPfLine,
+    p: PricePfLine,
+    freqs: Iterable[str] = ("YS", "QS", "MS"),
+    how: str = "val",
+    peak_fn: tools.peakfn.PeakFunction = None,
+) -> Dict[str, FlatPfLine]:
+    return self.flatten().hedge_cascade_with(p, freqs, how, peak_fn)
+
+
 def __bool__(self: NestedPfLine) -> bool:
     # True if a) has children of which b) any are true
     return any(self.children.keys())
 
 
+def fingerprint(self: NestedPfLine) -> str:
+    parts = ["nested", self.kind.value[0]]
+    for name in sorted(self.children):
+        parts.extend([name, self.children[name].fingerprint])
+    return fp.digest(parts)
+
+
 def __eq__(self: NestedPfLine, other: Any) -> bool:
     if not isinstance(other, self.__class__):
         return False
+    if self is other or self.fingerprint == other.fingerprint:
+        return True
     return self.children == other.children
 
 
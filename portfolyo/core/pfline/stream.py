@@ -0,0 +1,193 @@
+"""Create flat portfolio line from consecutive chunks of data, e.g. when reading a large
+file piece by piece."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+from ... import tools
+from ..shared import validation
+from . import classes, flat_helper
+from .enums import Kind, Structure
+
+
+class Builder:
+    """Build a flat portfolio line from consecutive chunks of data, without keeping the
+    chunks themselves in memory.
+
+    Parameters
+    ----------
+    freq : str, optional (default: frequency of the first chunk)
+        Frequency of the data in the chunks.
+    asfreq : str, optional (default: None)
+        If specified, only keep the values resampled to this frequency (e.g. 'MS' for
+        month). The data at the original frequency is then never kept in memory.
+    periods : int, optional (default: None)
+        Expected number of timestamps (at frequency ``freq``) in all chunks together.
+        Used to allocate memory up-front; only relevant if ``asfreq`` is not specified.
+
+    Notes
+    -----
+    Each chunk is a Series or DataFrame, as would be passed to ``portfolyo.PfLine()``,
+    with an index that continues exactly where the index of the previous chunk ended.
+    The chunks need not start or end at the start of a day, as long as the data in all
+    chunks together contain full days. Only the data in each chunk is verified; not the
+    data that was added before.
+    """
+
+    def __init__(self, freq: str = None, asfreq: str = None, periods: int = None):
+        if freq is not None:
+            tools.freq.assert_freq_valid(freq)
+        if asfreq is not None:
+            tools.freq.assert_freq_valid(asfreq)
+        self._freq = freq
+        self._asfreq = asfreq
+        self._capacity = periods or 0
+        self._kind: Kind = None
+        self._start: pd.Timestamp = None  # first timestamp
+        self._first: pd.Timestamp = None  # first timestamp after resampling
+        self._next: pd.Timestamp = None  # timestamp that next chunk must start with
+        self._buffers: Dict[str, np.ndarray] = {}  # values at (as)freq
+        self._count = 0  # number of values in the buffers
+        self._carry: pd.DataFrame = None  # values of incomplete period (if asfreq)
+
+    def append(self, chunk: pd.Series | pd.DataFrame) -> None:
+        """Add the data in ``chunk``. Its index must start where the index of the
+        previous chunk ended."""
+        if not len(chunk):
+            return
+        index = self._expected_index(chunk.index)
+        with validation.index_verified():
+            df, kind = flat_helper.dataframe_and_kind(chunk.set_axis(index))
+        if self._kind is None:
+            self._kind = kind
+        elif kind is not self._kind:
+            raise ValueError(
+                f"All chunks must contain the same kind of data; found {self._kind} and {kind}."
+            )
+        self._next = tools.right.stamp(index[-1], self._freq)
+
+        if self._asfreq is None:
+            self._add(df)
+        else:
+            self._add_resampled(df)
+
+    def pfline(self) -> classes.FlatPfLine:
+        """Portfolio line with the data of all chunks added so far."""
+        if self._kind is None:
+            raise ValueError("No data has been added.")
+        if self._asfreq is None:
+            index = pd.date_range(self._start, periods=self._count, freq=self._freq)
+            try:
+                tools.standardize.assert_window_standardized(index)
+            except AssertionError as e:
+                raise ValueError(
+                    "Timeseries not in expected form. See ``portfolyo.standardize()`` for more information."
+                ) from e
+        elif self._count:
+            index = pd.date_range(self._first, periods=self._count, freq=self._asfreq)
+        else:
+            raise ValueError(
+                f"There are no full periods available when changing to the frequency {self._asfreq}."
+            )
+        values = {col: buf[: self._count] for col, buf in self._buffers.items()}
+        df = pd.DataFrame(
+            {
+                col: pd.Series(
+                    tools.unit.PA_(
+                        v, dtype=tools.unit.pinttype(tools.unit.from_name(col))
+                    ),
+                    index,
+                )
+                for col, v in values.items()
+            },
+            copy=False,
+        )
+        with validation.trusted():
+            return classes.constructor(Structure.FLAT, self._kind)(df)
+
+    def _expected_index(self, index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+        """Index that chunk with index ``index`` must have, with frequency set."""
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError(f"Expecting DatetimeIndex; got {type(index)}.")
+        if self._start is None:  # first chunk
+            if self._freq is None:
+                self._freq = tools.freq.guess_to_index(index).freqstr
+                if self._freq is None:
+                    raise ValueError(
+                        "Cannot determine the frequency from the first chunk; pass it explicitly."
+                    )
+            if self._asfreq is not None:
+                tools.freq.assert_freq_sufficiently_long(self._asfreq, self._freq)
+            if index[0].minute != 0:
+                raise ValueError(
+                    f"The first timestamp must be at a full hour; found {index[0]}."
+                )
+            self._start = self._next = index[0]
+        expected = pd.date_range(self._next, periods=len(index), freq=self._freq)
+        if str(index.tz) != str(expected.tz):
+            raise ValueError(
+                f"All chunks must have the same timezone; expected {expected.tz}, found {index.tz}."
+            )
+        if index[0] != expected[0]:
+            raise ValueError(
+                f"Chunk must start where previous chunk ended ({expected[0]}); found {index[0]}."
+            )
+        if not (index.asi8 == expected.asi8).all():
+            raise ValueError(
+                f"Timestamps in chunk must be gapless, with frequency {self._freq}."
+            )
+        return expected
+
+    def _add(self, df: pd.DataFrame) -> None:
+        """Copy values in ``df`` into buffers; with amortized growth."""
+        n = len(df)
+        if self._count + n > self._capacity:
+            self._capacity = max(self._count + n, 2 * self._capacity)
+        for col, s in df.items():
+            buf = self._buffers.get(col)
+            if buf is None or len(buf) < self._capacity:
+                newbuf = np.empty(self._capacity)
+                if buf is not None:
+                    newbuf[: self._count] = buf[: self._count]
+                self._buffers[col] = buf = newbuf
+            buf[self._count : self._count + n] = s.pint.magnitude.to_numpy(dtype=float)
+        self._count += n
+
+    def _add_resampled(self, df: pd.DataFrame) -> None:
+        """Resample the full periods (at ``asfreq``) in the values so far, and keep the
+        values of the final (incomplete) period for the next chunk."""
+        if self._carry is not None:
+            df = pd.concat([self._carry, df])
+            df.index.freq = self._freq
+        cut = tools.floor.stamp(self._next, self._asfreq, 0, self._start.time())
+        pos = df.index.searchsorted(cut)
+        full, self._carry = df.iloc[:pos], df.iloc[pos:]
+        if not len(full):
+            return
+        # (Leading periods that are incomplete are dropped when resampling.)
+        with validation.trusted():
+            pfl = classes.constructor(Structure.FLAT, self._kind)(full)
+            try:
+                resampled = pfl.asfreq(self._asfreq).df
+            except ValueError:  # no full periods
+                return
+        if self._first is None:
+            self._first = resampled.index[0]
+        self._add(resampled)
+
+
+def from_chunks(
+    chunks: Iterable[pd.Series | pd.DataFrame],
+    freq: str = None,
+    asfreq: str = None,
+    periods: int = None,
+) -> classes.FlatPfLine:
+    """Create flat portfolio line from consecutive chunks of data. See ``Builder``."""
+    builder = Builder(freq, asfreq, periods)
+    for chunk in chunks:
+        builder.append(chunk)
+    return builder.pfline()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Iterable
 
 import colorama
@@ -12,6 +13,8 @@ from .enums import Kind
 if TYPE_CHECKING:
     from .classes import PfLine
 
+MAX_CHILDREN = 10  # maximum number of children to show in tree
+
 
 def _what(pfl: PfLine) -> str:
     return {
@@ -24,17 +27,26 @@ def _what(pfl: PfLine) -> str:
 
 def _children_info(pfl: PfLine) -> Iterable[str]:
     """Info about the children of the portfolio line."""
-    childtxt = [f"'{name}' ({_what(child)})" for name, child in pfl.items()]
+    shown = itertools.islice(pfl.items(), MAX_CHILDREN)
+    childtxt = [f"'{name}' ({_what(child)})" for name, child in shown]
+    if (hidden := len(pfl) - len(childtxt)) > 0:
+        childtxt.append(f"... ({hidden} more; {len(pfl)} in total)")
     return [". Children: " + ("none" if not childtxt else ", ".join(childtxt))]
 
 
-def _flatdatablock(pfl: PfLine, cols: Iterable[str], num_of_ts: int) -> Iterable[str]:
-    """The timestamps and data to be shown in a block, next to the tree."""
+def _flatdatablock(
+    pfl: PfLine, cols: Iterable[str], num_of_ts: int, tail: PfLine = None
+) -> Iterable[str]:
+    """The timestamps and data to be shown in a block, next to the tree. If ``tail`` is
+    provided, the last timestamps are taken from it instead of from ``pfl``."""
     # Obtain dataframe with index = timestamp as string and columns = one or more of 'qwpr'.
-    df = pfl.df[list(cols)]
-    # . (roughly) reduce number of timestamps to increase speed of conversion to strings.
-    if len(df.index) > num_of_ts * 2:
+    df = pfl.df
+    # . (roughly) reduce number of timestamps before doing anything else, for speed.
+    if tail is not None:
+        df = pd.concat([df.iloc[:num_of_ts, :], tail.df.iloc[-num_of_ts:, :]], axis=0)
+    elif len(df.index) > num_of_ts * 2:
         df = pd.concat([df.iloc[:num_of_ts, :], df.iloc[-num_of_ts:, :]], axis=0)
+    df = df[list(cols)]
     # . turn values into strings.
     df = shared_text.df_with_strvalues(df)
     # . turn index into strings and reduce to wanted number of datapoints
@@ -47,16 +59,26 @@ def _flatdatablock(pfl: PfLine, cols: Iterable[str], num_of_ts: int) -> Iterable
 
 
 def _childrenlines(
-    pfl: PfLine, cols: Iterable[str], num_of_ts: int, depth: int
+    pfl: PfLine, cols: Iterable[str], num_of_ts: int, depth: int, tail: PfLine = None
 ) -> Iterable[str]:
     """Treeview of only the children."""
     out = []
     if isinstance(pfl, classes.FlatPfLine):
         return out
-    for c, (name, child) in enumerate(pfl.items()):
-        is_last, is_only = (c == len(pfl) - 1), (len(pfl) == 1)
+    num_shown = min(len(pfl), MAX_CHILDREN)
+    hidden = len(pfl) - num_shown
+    for c, (name, child) in enumerate(itertools.islice(pfl.items(), num_shown)):
+        is_last, is_only = (c == num_shown - 1 and not hidden), (len(pfl) == 1)
+        childtail = None if tail is None else tail[name]
         out.extend(
-            nestedtree(name, child, cols, num_of_ts, depth + 1, is_last, is_only)
+            nestedtree(
+                name, child, cols, num_of_ts, depth + 1, is_last, is_only, childtail
+            )
+        )
+    if hidden:
+        tree = shared_text.treedict(depth + 1, True, False)
+        out.append(
+            tree["00"] + tree["01"] + f"... ({hidden} more; {len(pfl)} in total)"
         )
     return out
 
@@ -72,8 +94,10 @@ def nestedtree(
     depth: int = 0,
     is_last: bool = True,
     is_only: bool = False,
+    tail: PfLine = None,
 ) -> Iterable[str]:
-    """Treeview of the portfolio line."""
+    """Treeview of the portfolio line. If ``tail`` (portfolio line with same structure)
+    is provided, the last timestamps are taken from it instead of from ``pfl``."""
     out = []
     tree = shared_text.treedict(depth, is_last, isinstance(pfl, classes.NestedPfLine))
     # Name.
@@ -82,11 +106,11 @@ def nestedtree(
     if is_only and depth > 0:
         txtlines = ["(only contributor to parent data; has same values)"]
     else:
-        txtlines = _flatdatablock(pfl, cols, num_of_ts)
+        txtlines = _flatdatablock(pfl, cols, num_of_ts, tail)
     for txtline in txtlines:
         out.append(tree["10"] + tree["11"] + colorama.Style.RESET_ALL + txtline)
     # Add children if any.
-    for txtline in _childrenlines(pfl, cols, num_of_ts, depth):
+    for txtline in _childrenlines(pfl, cols, num_of_ts, depth, tail):
         out.append(tree["10"] + txtline)
     return out
 
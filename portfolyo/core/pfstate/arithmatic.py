@@ -71,7 +71,9 @@ class Prep:
             s = pd.Series(value, refindex)
             return Prep._prep_data(s, refindex)
         elif isinstance(value, tools.unit.Q_):
-            s = pd.Series(value.magnitude, refindex, dtype=f"pint[{value.units:P}]")
+            s = pd.Series(
+                value.magnitude, refindex, dtype=tools.unit.pinttype(value.units)
+            )
             return Prep._prep_data(s, refindex)
 
         raise TypeError(f"Cannot handle inputs of this type; got {type(value)}.")
@@ -7,13 +7,18 @@ from __future__ import annotations
 
 import dataclasses
 import warnings
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional
 
 import pandas as pd
 
 from ... import tools
 from ..pfline import PfLine, create
+from ..shared import fingerprint as fp
+from ..shared import validation
+from ..shared.cache import CachedDerived, derived, memoized
+from ..shared.arrow import ArrowOutput
 from ..shared.excelclipboard import ExcelClipboardOutput
+from ..shared.pickling import Picklable
 from ..shared.ndframelike import NDFrameLike
 from . import pfstate_helper
 from .arithmatic import PfStateArithmatic
@@ -23,7 +28,14 @@ from .text import PfStateText
 
 @dataclasses.dataclass(frozen=True, repr=False)
 class PfState(
-    NDFrameLike, PfStateText, PfStatePlot, ExcelClipboardOutput, PfStateArithmatic
+    NDFrameLike,
+    PfStateText,
+    PfStatePlot,
+    ExcelClipboardOutput,
+    ArrowOutput,
+    Picklable,
+    PfStateArithmatic,
+    CachedDerived,
 ):
     """Class to hold timeseries information of an energy portfolio, at a specific moment.
 
@@ -66,6 +78,11 @@ class PfState(
     pnl_cost : price-and-volume PfLine
         The expected costs needed to source the offtake volume; the sum of the sourced
         and unsourced positions.
+
+    The derived portfolio lines (``unsourced``, ``netposition``, ``pnl_cost``,
+    ``sourcedfraction``) are calculated on first access and then cached on the
+    instance. See ``.cache_info()``, ``.clear_cache()`` and
+    ``portfolyo.settings.cache_derived``.
     """
 
     offtakevolume: PfLine
@@ -123,26 +140,34 @@ class PfState(
     def index(self) -> pd.DatetimeIndex:  # from ABC
         return self.offtakevolume.index
 
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the content (offtake volume, unsourced price, sourced volume and
+        price). Portfolio states with the same fingerprint are equal."""
+        pflines = [self.offtakevolume, self.unsourcedprice, self.sourced]
+        return fp.digest(["pfstate", *(pfl.fingerprint for pfl in pflines)])
+
     @property
     def offtake(self) -> PfLine:
         # Future development: return not volume-only but price-and-volume. (by including offtake prices)
         return self.offtakevolume
 
-    @property
+    @derived
     def unsourced(self) -> PfLine:
         return -(self.offtake.volume + self.sourced.volume) | self.unsourcedprice
 
-    @property
+    @derived
     def netposition(self) -> PfLine:
         return -self.unsourced
 
-    @property
+    @derived
     def pnl_cost(self):
-        return create.nestedpfline(
-            {"sourced": self.sourced, "unsourced": self.unsourced}
-        )
+        with validation.trusted():
+            return create.nestedpfline(
+                {"sourced": self.sourced, "unsourced": self.unsourced}
+            )
 
-    @property
+    @derived
     def sourcedfraction(self) -> pd.Series:
         return self.sourced.volume / -self.offtake.volume
 
@@ -154,7 +179,7 @@ class PfState(
         self,
         cols: Iterable[str] = None,
         *args,
-        has_units: bool = True,
+        has_units: bool = None,
         **kwargs,
     ) -> pd.DataFrame:
         """DataFrame for portfolio state in default units.
@@ -163,7 +188,7 @@ class PfState(
         ----------
         cols : str, optional (default: all that are available)
             The columns (w, q, p, r) to include in the dataframe.
-        has_units : bool, optional (default: True)
+        has_units : bool, optional (default: True, or False in magnitude mode)
             - If True, return dataframe with ``pint`` units. (The unit can be extracted
               as a column level with ``.pint.dequantify()``).
             - If False, return dataframe with float values.
@@ -203,6 +228,33 @@ class PfState(
     def add_sourced(self, add_sourced: PfLine) -> PfState:
         return self.set_sourced(self.sourced + add_sourced)  # warns
 
+    def append(self, other: PfState) -> PfState:
+        """Return portfolio state with the data of ``other`` added at the end.
+
+        Parameters
+        ----------
+        other : PfState
+            Portfolio state with same frequency and timezone, and with portfolio lines
+            that can be appended to those of this portfolio state. Its index must start
+            where the index of this portfolio state ends.
+
+        Returns
+        -------
+        PfState
+
+        See also
+        --------
+        PfLine.append
+        """
+        if not isinstance(other, PfState):
+            raise TypeError(f"Can only append PfState; got {type(other)}.")
+        offtakevolume = self.offtakevolume.append(other.offtakevolume)
+        unsourcedprice = self.unsourcedprice.append(other.unsourcedprice)
+        sourced = self.sourced.append(other.sourced)
+        with validation.trusted():
+            return PfState(offtakevolume, unsourcedprice, sourced)
+
+    @memoized
     def asfreq(self, freq: str = "MS") -> PfState:  # from ABC
         """Resample the Portfolio to a new frequency.
 
@@ -221,7 +273,8 @@ class PfState(
         offtakevolume = self.offtakevolume.asfreq(freq)
         unsourcedprice = self.unsourced.asfreq(freq).price  # ensures weighted avg
         sourced = self.sourced.asfreq(freq)
-        return PfState(offtakevolume, unsourcedprice, sourced)
+        with validation.trusted():
+            return PfState(offtakevolume, unsourcedprice, sourced)
 
     def hedge_of_unsourced(
         self: PfState,
@@ -255,6 +308,42 @@ class PfState(
         """
         return self.unsourced.volume.hedge_with(self.unsourcedprice, how, peak_fn, freq)
 
+    def hedge_cascade_of_unsourced(
+        self: PfState,
+        freqs: Iterable[str] = ("YS", "QS", "MS"),
+        how: str = "val",
+        peak_fn: tools.peakfn.PeakFunction = None,
+    ) -> Dict[str, PfLine]:
+        """Hedge the unsourced volume, at unsourced prices in the portfolio, in several
+        steps. Each step hedges the volume that is left open by the previous steps.
+
+        Parameters
+        ----------
+        freqs : Iterable[str], optional (default: ('YS', 'QS', 'MS'))
+            Frequencies of the hedging products, in the order in which they are bought.
+            Each one of 'D' (days), 'MS' (months), 'QS' (quarters), 'YS' (years).
+        how : str, optional (Default: 'val')
+            Hedge-constraint. 'vol' for volumetric hedge, 'val' for value hedge.
+        peak_fn : PeakFunction, optional (default: None)
+            To hedge with peak and offpeak products: function that returns boolean
+            Series indicating if timestamps in index lie in peak period.
+            If None, hedge with base products. Daily products are always base products.
+
+        See also
+        --------
+        PfState.hedge_of_unsourced
+        PfLine.hedge_cascade_with
+
+        Returns
+        -------
+        Dict[str, PfLine]
+            For each frequency in ``freqs``: hedge (volumes and prices) with products of
+            that frequency.
+        """
+        return self.unsourced.volume.hedge_cascade_with(
+            self.unsourcedprice, freqs, how, peak_fn
+        )
+
     def source_unsourced(
         self: PfState,
         how: str = "val",
@@ -284,9 +373,10 @@ class PfState(
             which is fully hedged at time scales of ``freq`` or longer.
         """
         tosource = self.hedge_of_unsourced(how, peak_fn, freq)
-        return self.__class__(
-            self.offtakevolume, self.unsourcedprice, self.sourced + tosource
-        )
+        with validation.trusted():
+            return self.__class__(
+                self.offtakevolume, self.unsourcedprice, self.sourced + tosource
+            )
 
     def mtm_of_sourced(self) -> PfLine:
         """Mark-to-Market value of sourced volume."""
@@ -301,6 +391,8 @@ class PfState(
     def __eq__(self, other):  # from ABC
         if not isinstance(other, PfState):
             return False
+        if self is other or self.fingerprint == other.fingerprint:
+            return True
         return all(
             [self[part] == other[part] for part in ["offtake", "unsourced", "sourced"]]
         )
@@ -317,6 +409,27 @@ class PfState(
         return _SliceIndexer(self)
 
 
+def _window(pfs: PfState, indexer: str, arg) -> PfState:
+    """Portfolio state with subset of rows of ``pfs``, obtained with the ``indexer``
+    ('loc' or 'slice') of its portfolio lines. The portfolio lines of ``pfs`` already
+    share the same index, so the checks done at initialisation are skipped. Derived
+    values that are cached on ``pfs`` are sliced as well, instead of recalculated."""
+    offtakevolume = getattr(pfs.offtakevolume, indexer)[arg]
+    unsourcedprice = getattr(pfs.unsourcedprice, indexer)[arg]
+    sourced = getattr(pfs.sourced, indexer)[arg]
+    new = pfs.__class__.__new__(pfs.__class__)
+    object.__setattr__(new, "offtakevolume", offtakevolume)
+    object.__setattr__(new, "unsourcedprice", unsourcedprice)
+    object.__setattr__(new, "sourced", sourced)
+    for name in pfs.cache_info():
+        value = pfs.__dict__[name]
+        if isinstance(value, PfLine):
+            new.__dict__[name] = getattr(value, indexer)[arg]
+        else:  # series
+            new.__dict__[name] = value.loc[offtakevolume.index]
+    return new
+
+
 class _LocIndexer:
     """Helper class to obtain PfState instance, whose index is subset of original index."""
 
@@ -324,10 +437,7 @@ class _LocIndexer:
         self.pfs = pfs
 
     def __getitem__(self, arg) -> PfState:
-        offtakevolume = self.pfs.offtake.volume.loc[arg]
-        unsourcedprice = self.pfs.unsourcedprice.loc[arg]
-        sourced = self.pfs.sourced.loc[arg]
-        return PfState(offtakevolume, unsourcedprice, sourced)
+        return _window(self.pfs, "loc", arg)
 
 
 class _SliceIndexer:
@@ -338,7 +448,4 @@ class _SliceIndexer:
         self.pfs = pfs
 
     def __getitem__(self, arg) -> PfState:
-        offtakevolume = self.pfs.offtake.volume.slice[arg]
-        unsourcedprice = self.pfs.unsourcedprice.slice[arg]
-        sourced = self.pfs.sourced.slice[arg]
-        return PfState(offtakevolume, unsourcedprice, sourced)
+        return _window(self.pfs, "slice", arg)
@@ -7,6 +7,7 @@ import pandas as pd
 
 from ... import tools
 from ..pfline import Kind, PfLine, create
+from ..shared import validation
 
 
 def make_pflines(
@@ -53,6 +54,8 @@ def prepare_unsourcedprice(unsourcedprice: Any, ref_idx: pd.DatetimeIndex) -> Pf
             "Parameter ``unsourcedprice``: also contains volume infomation; this is discarded."
         )
         unsourcedprice = unsourcedprice.price
+    if not validation.checks_index():
+        return unsourcedprice
     try:
         tools.testing.assert_indices_compatible(ref_idx, unsourcedprice.index)
     except AssertionError as e:
@@ -72,6 +75,8 @@ def prepare_sourced(sourced: Any, ref_idx: pd.DatetimeIndex) -> PfLine:
     sourced = create.pfline(sourced)
     if sourced.kind is not Kind.COMPLETE:
         raise ValueError("Parameter ``sourced`` does not contain price and volume.")
+    if not validation.checks_index():
+        return sourced
     try:
         tools.testing.assert_indices_compatible(ref_idx, sourced.index)
     except AssertionError as e:
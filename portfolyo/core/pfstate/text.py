@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
+from ... import tools
 from ..pfline import text as pfline_text
+from ..shared import cache
 from ..shared import text as shared_text
 
 if TYPE_CHECKING:
+    from ..pfline import PfLine
     from .pfstate import PfState
 
 
+def _pnl_cost(pfs: PfState, num_of_ts: int) -> Tuple[PfLine, PfLine | None]:
+    """The pnl_cost portfolio line and None, or, if it is long and not yet calculated,
+    two portfolio lines containing (at least) its first and last ``num_of_ts`` rows."""
+    i = pfs.index
+    if cache.is_cached(pfs, "pnl_cost") or len(i) <= num_of_ts * 2:
+        return pfs.pnl_cost, None  # already cached, or short
+    # Slice first, calculate second. Slices must contain full days.
+    head_end, tail_start = i[num_of_ts], i[-num_of_ts]
+    if tools.freq.up_or_down(i.freq, "h") <= 0:
+        start_of_day = tools.startofday.get(i)
+        head_end = tools.ceil.stamp(head_end, "D", 0, start_of_day)
+        tail_start = tools.floor.stamp(tail_start, "D", 0, start_of_day)
+        if head_end >= tail_start:
+            return pfs.pnl_cost, None
+    return pfs.slice[:head_end].pnl_cost, pfs.slice[tail_start:].pnl_cost
+
+
 def pfs_as_string(pfs: PfState, num_of_ts: int, color: bool) -> str:
     lines = ["PfState object."]
     lines.extend(shared_text.index_info(pfs.index))
     spaces = " " * (shared_text.MAX_DEPTH + 5)
     lines.extend([spaces + txtline for txtline in shared_text.dataheader("wqpr")])
     lines.extend(pfline_text.nestedtree("offtake", pfs.offtakevolume, "wq", num_of_ts))
-    lines.extend(pfline_text.nestedtree("pnl_cost", pfs.pnl_cost, "wqpr", num_of_ts))
+    head, tail = _pnl_cost(pfs, num_of_ts)
+    lines.extend(pfline_text.nestedtree("pnl_cost", head, "wqpr", num_of_ts, tail=tail))
     txt = "\n".join(lines)
     return txt if color else shared_text.remove_color(txt)
 
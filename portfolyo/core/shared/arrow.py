@@ -0,0 +1,266 @@
+"""
+Saving and loading PfLine and PfState objects in the (Apache) Arrow format, and in
+parquet and feather (i.e., arrow IPC) files.
+
+All values are stored as float64 columns in a single table; one column per timeseries
+of each (flat) portfolio line. The structure of the object, and everything needed to
+recreate it (units, kinds, names of children, frequency, timezone, start-of-day) is
+stored in the table's metadata.
+
+Uncompressed feather files can be memory-mapped. The values of the loaded objects are
+then not read into memory, but point to the file, and are only read from disk when
+they are needed in a calculation.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+from ... import tools
+from . import validation
+from .ndframelike import NDFrameLike
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency; only needed for the functions in this module
+    pa = feather = pq = None
+
+METADATA_KEY = b"portfolyo"
+FORMAT_VERSION = 1
+PFSTATE_PARTS = ("offtakevolume", "unsourcedprice", "sourced")
+
+_unit = functools.lru_cache(maxsize=None)(tools.unit.Unit)  # parse every unit once
+
+
+class ArrowOutput:  # for both PfLine and PfState
+    def to_arrow(self: NDFrameLike) -> pa.Table:
+        """Table with the data as float64 columns, and with metadata (units, kinds,
+        children, frequency, timezone) to recreate the object with ``portfolyo.from_arrow()``.
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        return table(self)
+
+    def to_parquet(self: NDFrameLike, path: str | Path, **kwargs) -> None:
+        """Save to parquet file. Can be loaded with ``portfolyo.read_parquet()``.
+
+        Parameters
+        ----------
+        path : str | Path
+            Location of the file.
+        **kwargs
+            Passed on to ``pyarrow.parquet.write_table``.
+        """
+        pq.write_table(table(self), path, **kwargs)
+
+    def to_feather(
+        self: NDFrameLike, path: str | Path, compression: str = "uncompressed"
+    ) -> None:
+        """Save to feather (i.e., arrow IPC) file. Can be loaded with
+        ``portfolyo.read_feather()``.
+
+        Parameters
+        ----------
+        path : str | Path
+            Location of the file.
+        compression : {'uncompressed' (default), 'lz4', 'zstd'}
+            Only uncompressed files can be memory-mapped when loading them.
+        """
+        tbl = table(self)
+        # Single chunk per column, so that it can be memory-mapped as one array.
+        chunksize = max(tbl.num_rows, 1)
+        feather.write_feather(tbl, path, compression=compression, chunksize=chunksize)
+
+
+def _assert_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "The package ``pyarrow`` is needed to save to and load from the arrow and parquet formats."
+        )
+
+
+def table(obj: NDFrameLike) -> pa.Table:
+    """Arrow table with data and metadata of PfLine or PfState ``obj``."""
+    _assert_pyarrow()
+    i = obj.index
+    columns = {"ts_left" if i.name is None else str(i.name): i}
+    if hasattr(obj, "offtakevolume"):
+        objtype = "pfstate"
+        tree = {part: _node(obj[part], [part], columns) for part in PFSTATE_PARTS}
+    else:
+        objtype = "pfline"
+        tree = _node(obj, [], columns)
+    metadata = {
+        "version": FORMAT_VERSION,
+        "type": objtype,
+        "index": {
+            "column": next(iter(columns)),
+            "name": i.name,
+            "freq": i.freqstr,
+            "tz": None if i.tz is None else str(i.tz),
+            "start_of_day": tools.startofday.get(i, "str"),
+            "start": i[0].value,  # (in UTC if tz-aware)
+            "periods": len(i),
+        },
+        "tree": tree,
+    }
+    return pa.table(
+        columns, metadata={METADATA_KEY: json.dumps(metadata).encode("utf-8")}
+    )
+
+
+def _node(pfl, path: Iterable[str], columns: Dict[str, Any]) -> Dict:
+    """Description of (possibly nested) portfolio line ``pfl``. Its float values are
+    added to ``columns``."""
+    node = {"structure": pfl.structure.name, "kind": pfl.kind.name}
+    if node["structure"] == "NESTED":
+        node["children"] = [
+            [name, _node(child, [*path, name], columns)] for name, child in pfl.items()
+        ]
+        return node
+    node["columns"] = {}
+    for col, s in pfl.df.items():
+        colname = "/".join([*path, col])
+        while colname in columns:  # child names that contain '/'
+            colname += "_"
+        columns[colname] = s.pint.magnitude.to_numpy(dtype=float)
+        node["columns"][col] = [colname, str(s.pint.units)]
+    return node
+
+
+def from_arrow(tbl: pa.Table) -> Any:
+    """Recreate a PfLine or PfState from an arrow table.
+
+    Parameters
+    ----------
+    tbl : pyarrow.Table
+        Table as created with the ``.to_arrow()`` method.
+
+    Returns
+    -------
+    PfLine | PfState
+
+    Notes
+    -----
+    The data is not verified (apart from the index); it is assumed to be correct, as it
+    was stored by portfolyo.
+    """
+    _assert_pyarrow()
+    if tbl.schema.metadata is None or METADATA_KEY not in tbl.schema.metadata:
+        raise ValueError("Table does not contain portfolyo metadata.")
+    metadata = json.loads(tbl.schema.metadata[METADATA_KEY])
+    if metadata["version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"Table was saved with a newer version of portfolyo (format {metadata['version']})."
+        )
+    index = _index(tbl, metadata["index"])
+
+    # Imported here to avoid circular imports.
+    from ..pfline import classes
+    from ..pfstate import PfState
+
+    def pfline(node: Dict) -> Any:
+        structure, kind = (
+            classes.Structure[node["structure"]],
+            classes.Kind[node["kind"]],
+        )
+        if structure is classes.Structure.NESTED:
+            data = {name: pfline(child) for name, child in node["children"]}
+        else:
+            data = pd.DataFrame(
+                {
+                    col: tools.unit.convert(
+                        pd.Series(_values(tbl.column(colname)), index),
+                        _unit(unit),
+                    )
+                    for col, (colname, unit) in node["columns"].items()
+                },
+                copy=False,
+            )
+        return classes.constructor(structure, kind)(data)
+
+    with validation.trusted():
+        if metadata["type"] == "pfstate":
+            return PfState(*(pfline(metadata["tree"][p]) for p in PFSTATE_PARTS))
+        return pfline(metadata["tree"])
+
+
+def read_parquet(path: str | Path, **kwargs) -> Any:
+    """Load a PfLine or PfState from a parquet file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Location of the file, as saved with the ``.to_parquet()`` method.
+    **kwargs
+        Passed on to ``pyarrow.parquet.read_table``.
+
+    Returns
+    -------
+    PfLine | PfState
+    """
+    _assert_pyarrow()
+    return from_arrow(pq.read_table(path, **kwargs))
+
+
+def read_feather(path: str | Path, memory_map: bool = True) -> Any:
+    """Load a PfLine or PfState from a feather (i.e., arrow IPC) file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Location of the file, as saved with the ``.to_feather()`` method.
+    memory_map : bool, optional (default: True)
+        If True, the values are not read into memory, but point to the file. Only
+        possible for uncompressed files; compressed files are always read completely.
+
+    Returns
+    -------
+    PfLine | PfState
+
+    Notes
+    -----
+    With ``memory_map``, only the parts of the file that are needed are read from disk,
+    e.g. when selecting a few rows with ``.slice[]``. The file must not be changed while
+    the returned object is in use. The aggregate values of nested portfolio lines are
+    always calculated when loading, and kept in memory.
+    """
+    _assert_pyarrow()
+    return from_arrow(feather.read_table(path, memory_map=memory_map))
+
+
+def _values(column: pa.ChunkedArray) -> np.ndarray:
+    """Float values in arrow column; without copying them, if possible."""
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _index(tbl: pa.Table, meta: Dict) -> pd.DatetimeIndex:
+    """Index described by ``meta``; verified with the timestamps stored in ``tbl``."""
+    start = pd.Timestamp(meta["start"])
+    if meta["tz"] is not None:
+        start = start.tz_localize("UTC").tz_convert(meta["tz"])
+    index = pd.date_range(start, freq=meta["freq"], periods=meta["periods"])
+    if tools.startofday.get(index, "str") != meta["start_of_day"]:
+        raise ValueError(
+            "Start-of-day of index does not match the one in the metadata."
+        )
+    # Only compare the ends; the intermediate timestamps follow from the frequency.
+    stamps = tbl.column(meta["column"])
+    if len(stamps) != len(index) or any(
+        pd.Timestamp(stamps[j].as_py()) != index[j] for j in (0, -1)
+    ):
+        raise ValueError("Timestamps in table do not match the index in its metadata.")
+    index.name = meta["name"]
+    return index
@@ -0,0 +1,218 @@
+"""
+Caching of values derived from PfLine and PfState objects. These are immutable, so a
+derived value, once calculated, never changes.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import functools
+import inspect
+import weakref
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Tuple
+
+import pandas as pd
+
+from ... import settings
+
+
+class derived:
+    """Decorator to turn a method into a property, whose value is calculated on first
+    access and then stored on the instance (unless ``portfolyo.settings.cache_derived``
+    is False). Also works on frozen dataclasses."""
+
+    def __init__(self, fn: Callable):
+        self.fn = fn
+        self.name = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # Only called if value is not yet stored in instance's __dict__.
+        value = self.fn(instance)
+        if settings.cache_derived:
+            instance.__dict__[self.name] = value
+        return value
+
+
+def is_cached(instance: Any, name: str) -> bool:
+    """True if derived value ``name`` has been calculated and stored on ``instance``."""
+    return isinstance(getattr(type(instance), name, None), derived) and (
+        name in instance.__dict__
+    )
+
+
+def _derived_names(cls: type) -> Iterable[str]:
+    """Names of all attributes of class ``cls`` that are derived properties."""
+    names = []
+    for klass in cls.__mro__:
+        names.extend(n for n, a in vars(klass).items() if isinstance(a, derived))
+    return names
+
+
+def nbytes(value: Any) -> int:
+    """(Approximate) memory usage of ``value`` in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, Mapping):  # e.g. children
+        return sum(nbytes(v) for v in value.values())
+    if dataclasses.is_dataclass(value):  # PfLine, PfState
+        fields = dataclasses.fields(value)
+        return sum(nbytes(getattr(value, field.name)) for field in fields)
+    return 0
+
+
+class CachedDerived:  # for both PfLine and PfState
+    def cache_info(self) -> Dict[str, int]:
+        """Derived values that are currently cached on this object.
+
+        Returns
+        -------
+        Dict[str, int]
+            Name of each cached value, and its (approximate) memory usage in bytes.
+        """
+        return {
+            name: nbytes(self.__dict__[name])
+            for name in _derived_names(type(self))
+            if name in self.__dict__
+        }
+
+    def clear_cache(self) -> None:
+        """Remove all cached derived values from this object, to free up memory.
+
+        Returns
+        -------
+        None
+        """
+        for name in _derived_names(type(self)):
+            self.__dict__.pop(name, None)
+
+
+class _Results:
+    """Store of method results, for all objects together. Results of an object are
+    removed when the object is garbage collected, and the least-recently used results
+    are removed when the total size exceeds ``portfolyo.settings.cache_results_maxbytes``.
+    """
+
+    def __init__(self):
+        self.entries: collections.OrderedDict[Tuple, Tuple[Any, int, Any]]
+        self.entries = collections.OrderedDict()  # key: (value, nbytes, arguments)
+        self.keys_of: Dict[int, set] = {}  # id of object: keys of its results
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, instance: Any, key: Tuple, calc: Callable[[], Any], arguments: Any):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+        self.misses += 1
+        value = calc()
+        size = nbytes(value)
+        if size > settings.cache_results_maxbytes:
+            return value  # too large to keep
+        if id(instance) not in self.keys_of:
+            self.keys_of[id(instance)] = set()
+            weakref.finalize(instance, self.drop_object, id(instance))
+        self.keys_of[id(instance)].add(key)
+        # Keep reference to arguments, so that their ids (used in key) are not reused.
+        self.entries[key] = (value, size, arguments)
+        self.nbytes += size
+        self.evict(settings.cache_results_maxbytes)
+        return value
+
+    def drop(self, key: Tuple) -> None:
+        _, size, _ = self.entries.pop(key)
+        self.nbytes -= size
+        if keys := self.keys_of.get(key[0]):
+            keys.discard(key)
+
+    def drop_object(self, instance_id: int) -> None:
+        for key in self.keys_of.pop(instance_id, ()):
+            if key in self.entries:
+                self.drop(key)
+
+    def evict(self, maxbytes: int) -> None:
+        while self.nbytes > maxbytes and self.entries:
+            self.drop(next(iter(self.entries)))
+
+    def clear(self) -> None:
+        for key in list(self.entries):
+            self.drop(key)
+        self.hits = self.misses = 0
+
+
+_RESULTS = _Results()
+
+
+def _hashable(value: Any) -> Hashable:
+    """Value to identify an argument in a cache key."""
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))  # e.g. PfLine, Series
+    return value
+
+
+def memoized(fn: Callable) -> Callable:
+    """Decorator for methods whose result only depends on the (immutable) instance and
+    the arguments. If ``portfolyo.settings.cache_results`` is True, the result is stored
+    and returned on the next call with the same arguments."""
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not settings.cache_results:
+            return fn(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]  # without self
+        key = (
+            id(self),
+            fn.__module__,
+            fn.__qualname__,
+            tuple((name, _hashable(value)) for name, value in arguments),
+        )
+        value = _RESULTS.get(self, key, lambda: fn(self, *args, **kwargs), arguments)
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            return value.copy()  # mutable
+        return value
+
+    return wrapper
+
+
+def results_info() -> Dict[str, int]:
+    """Information about the method results that are currently cached. (Only used if
+    ``portfolyo.settings.cache_results`` is True.)
+
+    Returns
+    -------
+    Dict[str, int]
+        Number of cache hits and misses since the last clearing, number of cached
+        results, and their (approximate) memory usage in bytes.
+    """
+    return {
+        "hits": _RESULTS.hits,
+        "misses": _RESULTS.misses,
+        "entries": len(_RESULTS.entries),
+        "nbytes": _RESULTS.nbytes,
+    }
+
+
+def clear_results() -> None:
+    """Remove all cached method results, and reset the hit and miss counters.
+
+    Returns
+    -------
+    None
+    """
+    _RESULTS.clear()
@@ -0,0 +1,42 @@
+"""
+Content fingerprints of PfLine and PfState objects: short strings that are equal for
+objects with identical content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+def digest(parts: Iterable[str | bytes]) -> str:
+    """Hash of the ``parts``, as 32-character hexadecimal string."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        part = part.encode() if isinstance(part, str) else part
+        h.update(len(part).to_bytes(8, "little"))  # so that parts cannot shift
+        h.update(part)
+    return h.hexdigest()
+
+
+def index(i: pd.DatetimeIndex) -> str:
+    """Description of a standardized index, which identifies it completely."""
+    if not len(i):
+        return f"{i.freq}|{i.tz}|0"
+    return f"{i.freq}|{i.tz}|{len(i)}|{i[0].value}|{i[-1].value}"
+
+
+def series(s: pd.Series) -> bytes:
+    """Unit and values of a (pint-)Series. NaN values and signed zeros are made uniform,
+    so that equal values always give the same bytes."""
+    unit = f"{s.pint.units:~P}|".encode() if hasattr(s, "pint") else b"|"
+    values = (
+        s.pint.magnitude.to_numpy(dtype=float)
+        if hasattr(s, "pint")
+        else s.to_numpy(dtype=float)
+    )
+    values = np.where(np.isnan(values), np.nan, values + 0.0)  # -0.0 + 0.0 == 0.0
+    return unit + values.tobytes()
@@ -0,0 +1,57 @@
+"""
+Magnitude mode: calculations with portfolio lines are done on the values in the default
+units, without ``pint``. See ``portfolyo.magnitude_mode()``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Iterator
+
+import pandas as pd
+
+from ... import tools
+
+_active: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "magnitude_mode", default=False
+)
+
+
+def active() -> bool:
+    """If magnitude mode is currently active."""
+    return _active.get()
+
+
+@contextlib.contextmanager
+def magnitude_mode() -> Iterator[None]:
+    """Context in which portfolio line calculations are done on float values instead of
+    on ``pint`` quantities, and in which dataframes are exported without units.
+
+    Notes
+    -----
+    The values of a portfolio line are always stored in the default units (MW, MWh,
+    Eur/MWh, Eur), so the results are the same; the units are reattached to the result
+    without unit conversion. Use ``.dataframe(has_units=True)`` to get units inside this
+    context.
+    """
+    token = _active.set(True)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def magnitudes(fr: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """Float magnitudes of a (pint-)Series, or of the (pint-)columns of a DataFrame."""
+    if isinstance(fr, pd.DataFrame):
+        return pd.DataFrame({col: magnitudes(s) for col, s in fr.items()})
+    return fr.pint.magnitude if hasattr(fr, "pint") else fr
+
+
+def quantify(df: pd.DataFrame) -> pd.DataFrame:
+    """Dataframe with float columns ``w``, ``q``, ``p``, ``r`` set to their default
+    unit."""
+    return pd.DataFrame(
+        {col: tools.unit.convert(s, tools.unit.from_name(col)) for col, s in df.items()}
+    )
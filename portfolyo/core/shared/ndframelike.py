@@ -53,7 +53,7 @@ class NDFrameLike(abc.ABC):
 
     @abc.abstractmethod
     def dataframe(
-        self, cols: Iterable[str] | None = None, has_units: bool = True, *args, **kwargs
+        self, cols: Iterable[str] | None = None, has_units: bool = None, *args, **kwargs
     ) -> pd.DataFrame:
         """DataFrame for portfolio line in default units.
 
@@ -62,7 +62,7 @@ class NDFrameLike(abc.ABC):
         cols : str, optional (default: all that are available)
             The columns (w, q, p, r) to include in the dataframe.
             Columns that are not available are silently excluded.
-        has_units : bool, optional (default: True)
+        has_units : bool, optional (default: True, or False in magnitude mode)
             - If True, return dataframe with ``pint`` units. (The unit can be extracted
                 as a column level with ``.pint.dequantify()``).
             - If False, return dataframe with float values.
@@ -0,0 +1,114 @@
+"""
+Compact pickling of PfLine and PfState objects.
+
+Only what is needed to recreate an object is pickled: a description of the index, the
+kind and structure of each portfolio line (and the names of its children), and, for
+each flat portfolio line, its values as float arrays with their units. The aggregate
+values of nested portfolio lines, cached derived values, and the pint registry are not
+pickled. With pickle protocol 5, the float arrays are passed as out-of-band buffers
+(see ``pickle.dumps(..., buffer_callback=...)``), so that they need not be copied.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, Tuple
+
+import pandas as pd
+
+from ... import tools
+from . import validation
+
+FORMAT_VERSION = 1
+PFSTATE_PARTS = ("offtakevolume", "unsourcedprice", "sourced")
+
+_unit = functools.lru_cache(maxsize=None)(tools.unit.Unit)  # parse every unit once
+
+
+class Picklable:  # for both PfLine and PfState
+    def __reduce__(self) -> Tuple:
+        return unpickle, (FORMAT_VERSION, *state(self))
+
+
+def state(obj: Any) -> Tuple[str, Dict, Any]:
+    """Type, index description, and tree with the values of PfLine or PfState ``obj``."""
+    if hasattr(obj, "offtakevolume"):
+        tree = {part: _node(obj[part]) for part in PFSTATE_PARTS}
+        return "pfstate", _index_description(obj.index), tree
+    return "pfline", _index_description(obj.index), _node(obj)
+
+
+def _index_description(i: pd.DatetimeIndex) -> Dict:
+    """Description of standardized index ``i``, from which it can be recreated."""
+    return {
+        "name": i.name,
+        "freq": i.freqstr,
+        "tz": None if i.tz is None else str(i.tz),
+        "start": i[0].value if len(i) else None,  # (in UTC if tz-aware)
+        "periods": len(i),
+    }
+
+
+def _node(pfl) -> Tuple:
+    """Structure, kind, and values (flat) or children (nested) of portfolio line ``pfl``."""
+    if pfl.structure.name == "NESTED":
+        children = [(name, _node(child)) for name, child in pfl.items()]
+        return ("NESTED", pfl.kind.name, children)
+    columns = {
+        col: (str(s.pint.units), s.pint.magnitude.to_numpy(dtype=float))
+        for col, s in pfl.df.items()
+    }
+    return ("FLAT", pfl.kind.name, columns)
+
+
+def unpickle(version: int, objtype: str, indexdescription: Dict, tree: Any) -> Any:
+    """Recreate a PfLine or PfState from its pickled state."""
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Object was pickled with a newer version of portfolyo (format {version})."
+        )
+    index = _index(indexdescription)
+
+    # Imported here to avoid circular imports.
+    from ..pfline import classes
+    from ..pfstate import PfState
+
+    def pfline(node: Tuple) -> Any:
+        structure, kind, content = node
+        structure, kind = classes.Structure[structure], classes.Kind[kind]
+        if structure is classes.Structure.NESTED:
+            data = {name: pfline(child) for name, child in content}
+        else:
+            data = pd.DataFrame(
+                {
+                    col: pd.Series(
+                        tools.unit.PA_(values, dtype=tools.unit.pinttype(_unit(unit))),
+                        index,
+                    )
+                    for col, (unit, values) in content.items()
+                },
+                copy=False,
+            )
+        # Aggregate values of nested portfolio lines are recalculated here.
+        return classes.constructor(structure, kind)(data)
+
+    # The data was correct when it was pickled.
+    with validation.trusted():
+        if objtype == "pfstate":
+            return PfState(*(pfline(tree[part]) for part in PFSTATE_PARTS))
+        return pfline(tree)
+
+
+def _index(description: Dict) -> pd.DatetimeIndex:
+    """Index described by ``description``."""
+    if description["start"] is None:
+        index = pd.DatetimeIndex([], freq=description["freq"], tz=description["tz"])
+    else:
+        start = pd.Timestamp(description["start"])
+        if description["tz"] is not None:
+            start = start.tz_localize("UTC").tz_convert(description["tz"])
+        index = pd.date_range(
+            start, freq=description["freq"], periods=description["periods"]
+        )
+    index.name = description["name"]
+    return index
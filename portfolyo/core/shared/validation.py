@@ -0,0 +1,66 @@
+"""
+How thoroughly input data is verified when creating PfLine and PfState objects. See
+``portfolyo.settings.validation``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Iterator
+
+from ... import settings
+
+LEVELS = ("full", "light", "trusted")
+
+# Set when creating objects from data that is correct by construction.
+_override: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "validation", default=None
+)
+# Set when creating objects from data whose index has already been verified.
+_index_verified: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "index_verified", default=False
+)
+
+
+def level() -> str:
+    """Current validation level; one of 'full', 'light', 'trusted'."""
+    if (current := _override.get()) is not None:
+        return current
+    if settings.validation not in LEVELS:
+        raise ValueError(
+            f"``portfolyo.settings.validation`` must be one of {', '.join(LEVELS)};"
+            f" found '{settings.validation}'."
+        )
+    return settings.validation
+
+
+def checks_consistency() -> bool:
+    """If values in the data (e.g. w and q) must be checked for consistency."""
+    return level() == "full"
+
+
+def checks_index() -> bool:
+    """If indices must be checked for being standardized and for overlapping."""
+    return level() != "trusted" and not _index_verified.get()
+
+
+@contextlib.contextmanager
+def trusted() -> Iterator[None]:
+    """Context in which the data used to create objects is not verified."""
+    token = _override.set("trusted")
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+@contextlib.contextmanager
+def index_verified() -> Iterator[None]:
+    """Context in which the index of the data used to create objects is not verified.
+    (The values still are, depending on the validation level.)"""
+    token = _index_verified.set(True)
+    try:
+        yield
+    finally:
+        _index_verified.reset(token)
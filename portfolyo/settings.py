@@ -0,0 +1,25 @@
+"""
+Package-wide settings. Change by setting the attribute, e.g.
+``portfolyo.settings.cache_derived = False``.
+"""
+
+# Store derived portfolio lines (e.g. ``PfState.unsourced``) on the (immutable) object
+# they are calculated from, so that they are only calculated once. Set to False to
+# always recalculate (e.g. to reduce memory usage).
+cache_derived: bool = True
+
+# How thoroughly input data is verified when creating PfLine and PfState objects.
+# - 'full': all checks.
+# - 'light': do not check if values are consistent with each other (e.g. `w` with `q`,
+#   and `r` with `p` * `q`).
+# - 'trusted': also do not check if indices are standardized and overlap.
+# Objects that are calculated by portfolyo itself are always created as 'trusted'.
+validation: str = "full"
+
+# Store the results of ``.asfreq()``, ``.po()`` and ``.hedge_with()`` (on PfLine), and
+# of ``.asfreq()`` (on PfState), so that calling the method again with the same
+# arguments on the same object returns the stored result. The results of an object are
+# removed when it is garbage collected. If the total (approximate) memory usage exceeds
+# ``cache_results_maxbytes``, the least-recently used results are removed.
+cache_results: bool = False
+cache_results_maxbytes: int = 256 * 1024**2
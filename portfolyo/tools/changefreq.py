@@ -3,12 +3,14 @@
 from typing import Any
 
 import pandas as pd
+import pint_pandas
 
 from . import duration as tools_duration
 from . import freq as tools_freq
 from . import right as tools_right
 from . import startofday as tools_startofday
 from . import trim as tools_trim
+from . import unit as tools_unit
 from .types import Series_or_DataFrame
 
 
@@ -21,6 +23,15 @@ def _astype(s: pd.Series, dtype: Any) -> pd.Series:
     return s.astype(dtype)
 
 
+def _duration(s: pd.Series) -> pd.Series:
+    """Duration of each timestamp in the index of ``s``; as hours (float) if ``s`` has
+    no unit."""
+    duration = tools_duration.frame(s)
+    if not isinstance(s.dtype, pint_pandas.PintType):
+        duration = duration.pint.m_as("h")
+    return duration
+
+
 def _emptyseries(s_ref: pd.Series, freq) -> pd.Series:
     i = pd.DatetimeIndex([], freq=freq, tz=s_ref.index.tz)
     return pd.Series([], i, dtype=s_ref.dtype, name=s_ref.name)
@@ -29,10 +40,10 @@ def _emptyseries(s_ref: pd.Series, freq) -> pd.Series:
 def _downsample_avgable(s: pd.Series, freq: str) -> pd.Series:
     """Downsample averagble series."""
     # For averagable series: first make summable.
-    duration = tools_duration.frame(s)
-    summable = s.mul(duration, axis=0)  # now has a pint dtype
+    duration = _duration(s)
+    summable = s.mul(duration, axis=0)
     summable2 = _downsample_summable(summable, freq)
-    duration2 = tools_duration.frame(summable2)
+    duration2 = _duration(summable2)
     s2 = summable2.div(duration2, axis=0)
     s2 = _astype(s2, s.dtype)
     return s2.rename(s.name)
@@ -72,10 +83,10 @@ def _downsample_summable(s: pd.Series, freq: str) -> pd.Series:
 def _upsample_summable(s: pd.Series, freq: str) -> pd.Series:
     """Upsample summable series."""
     # For summable series: first make averagable.
-    duration = tools_duration.frame(s)
-    avgable = s.div(duration, axis=0)  # now has a pint dtype
+    duration = _duration(s)
+    avgable = s.div(duration, axis=0)
     avgable2 = _upsample_avgable(avgable, freq)
-    duration2 = tools_duration.frame(avgable2)
+    duration2 = _duration(avgable2)
     s2 = avgable2.mul(duration2, axis=0)
     s2 = _astype(s2, s.dtype)
     return s2.rename(s.name)
@@ -151,8 +162,14 @@ def _general(is_summable: bool, s: pd.Series, freq: str = "MS") -> pd.Series:
         s.index.freq = freq
         return s
 
+    # Resample the magnitudes and reattach the unit afterwards. (pint-pandas has no fast
+    # path for resampling, and the unit is the same before and after.)
+    if isinstance(s.dtype, pint_pandas.PintType):
+        s2 = _general(is_summable, s.pint.magnitude.astype(float), freq)
+        return tools_unit.convert(s2, s.pint.units)
+
     # Must downsample.
-    elif up_or_down == -1:
+    if up_or_down == -1:
         if is_summable:
             return _downsample_summable(s, freq)
         else:
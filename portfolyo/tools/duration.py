@@ -57,7 +57,7 @@ def index(i: pd.DatetimeIndex) -> pd.Series:
         # Individual calculations for non-fixed-duration frequencies.
         h = (tools_right.index(i) - i).map(lambda td: td.total_seconds() / 3600)
 
-    return pd.Series(h, i, dtype="pint[h]").rename("duration")
+    return pd.Series(h, i, dtype=tools_unit.pinttype("h")).rename("duration")
 
 
 def frame(fr: pd.Series | pd.DataFrame) -> pd.Series:
@@ -1,15 +1,16 @@
 """Functionality to hedge an offtake profile with a price profile."""
 
-from typing import Tuple
+from typing import Dict, Iterable, Tuple
 
+import numpy as np
 import pandas as pd
 
 from . import isboundary as tools_boundary
 
 from . import duration as tools_duration
 from . import intersect as tools_intersect
-from . import peakconvert as tools_peakconvert
 from . import peakfn as tools_peakfn
+from . import startofday as tools_startofday
 from . import trim as tools_trim
 from . import wavg as tools_wavg
 
@@ -33,6 +34,41 @@ def one_hedge(df: pd.DataFrame, how: str) -> pd.Series:
     return pd.Series({"w": w_hedge, "p": p_hedge})
 
 
+def _check_arguments(
+    w: pd.Series,
+    p: pd.Series,
+    how: str,
+    peak_fn: tools_peakfn.PeakFunction,
+    freq: str,
+) -> None:
+    """Raise error if arguments to hedge function are invalid."""
+    if w.index.freq is None or p.index.freq is None:
+        raise ValueError(
+            "Parameters ``w`` and ``p`` must have a DatetimeIndex with a set frequency attribute."
+        )
+    if w.index.freq != p.index.freq:
+        raise ValueError(
+            f"Parameters ``w`` and ``p`` must have same frequency; got {w.index.freq} and {p.index.freq}."
+        )
+    if w.index.freq not in ["15min", "h", "D"]:
+        raise ValueError("Can only hedge a timeseries with daily (or shorter) values.")
+    # ATTN!: changed due to new freq
+    if not any(
+        tools_boundary.freq_to_string(freq).startswith(t)
+        for t in ["D", "MS", "QS", "YS"]
+    ):
+        raise ValueError(
+            f"Parameter ``freq`` must be one of 'D', 'MS', 'QS', 'YS'; got '{freq}'."
+        )
+    if peak_fn is not None and not (w.index.freq in ["15min", "h"] and freq != "D"):
+        raise ValueError(
+            "Split into peak and offpeak only possible when (a) hedging with monthly (or "
+            "longer) products, and (b) if timeseries have hourly (or shorter) values."
+        )
+    if how not in ["vol", "val"]:
+        raise ValueError(f"Parameter `how` must be 'val' or 'vol'; got {how}.")
+
+
 def hedge(
     w: pd.Series,
     p: pd.Series,
@@ -62,31 +98,7 @@ def hedge(
     Tuple[Series, Series]
         Power timeseries and price timeseries with hedge of ``w`` (with same index).
     """
-    if w.index.freq is None or p.index.freq is None:
-        raise ValueError(
-            "Parameters ``w`` and ``p`` must have a DatetimeIndex with a set frequency attribute."
-        )
-    if w.index.freq != p.index.freq:
-        raise ValueError(
-            f"Parameters ``w`` and ``p`` must have same frequency; got {w.index.freq} and {p.index.freq}."
-        )
-    if w.index.freq not in ["15min", "h", "D"]:
-        raise ValueError("Can only hedge a timeseries with daily (or shorter) values.")
-    # ATTN!: changed due to new freq
-    if not any(
-        tools_boundary.freq_to_string(freq).startswith(t)
-        for t in ["D", "MS", "QS", "YS"]
-    ):
-        raise ValueError(
-            f"Parameter ``freq`` must be one of 'D', 'MS', 'QS', 'YS'; got '{freq}'."
-        )
-    if peak_fn is not None and not (w.index.freq in ["15min", "h"] and freq != "D"):
-        raise ValueError(
-            "Split into peak and offpeak only possible when (a) hedging with monthly (or "
-            "longer) products, and (b) if timeseries have hourly (or shorter) values."
-        )
-    if how not in ["vol", "val"]:
-        raise ValueError(f"Parameter `how` must be 'val' or 'vol'; got {how}.")
+    _check_arguments(w, p, how, peak_fn, freq)
 
     # Handle possible units.
     win, wunits = (w.pint.magnitude, w.pint.units) if hasattr(w, "pint") else (w, None)
@@ -104,17 +116,162 @@ def hedge(
 
     # Do actual hedge.
     # . helper values
-    dfin["duration"] = tools_duration.index(dfin.index)
-    grouping = tools_peakconvert.group_index(dfin.index, peak_fn, freq)
-    # . calculation
-    vals = dfin.groupby(grouping).apply(lambda subdf: one_hedge(subdf, how))
-    vals.index = pd.MultiIndex.from_tuples(vals.index)
-    # . broadcast to original timeseries
-    dfout = vals.loc[grouping, :].set_axis(dfin.index)
-    wout, pout = dfout["w"], dfout["p"]
+    i = dfin.index
+    duration = tools_duration.index(i).pint.magnitude.to_numpy(dtype=float)
+    is_peak = None if peak_fn is None else np.asarray(peak_fn(i), dtype=bool)
+    codes = _group_codes(i, freq, is_peak)
+    # . calculation, broadcast to original timeseries
+    w_hedge, p_hedge = _hedge_groups(
+        dfin["w"].to_numpy(dtype=float),
+        dfin["p"].to_numpy(dtype=float),
+        duration,
+        codes,
+        how,
+    )
+    wout, pout = pd.Series(w_hedge, i, name="w"), pd.Series(p_hedge, i, name="p")
 
     # Handle possible units.
     if wunits or punits:
         wout, pout = wout.astype(f"pint[{wunits}]"), pout.astype(f"pint[{punits}]")
 
     return wout, pout
+
+
+def _group_codes(
+    i: pd.DatetimeIndex, freq: str, is_peak: np.ndarray = None
+) -> np.ndarray:
+    """Integer codes (0, 1, 2, ...) that are the same for all timestamps in ``i`` that
+    belong to the same hedging product (i.e., delivery period and, if ``is_peak`` is
+    provided, peak or offpeak)."""
+    # Delivery periods start at start-of-day; work with wall time shifted to midnight.
+    wall = i.tz_localize(None) if i.tz is not None else i
+    wall = wall - tools_startofday.get(i, "timedelta")
+    if freq == "D":
+        keys = wall.normalize().asi8 // 86_400_000_000_000
+    elif freq == "MS":
+        keys = wall.year.to_numpy() * 12 + wall.month.to_numpy()
+    elif freq == "QS":
+        keys = wall.year.to_numpy() * 4 + wall.quarter.to_numpy()
+    elif freq == "YS":
+        keys = wall.year.to_numpy()
+    else:
+        raise ValueError(
+            f"Parameter ``freq`` must be one of 'D', 'MS', 'QS', 'YS'; got '{freq}'."
+        )
+    if is_peak is not None:
+        keys = keys * 2 + is_peak.astype(int)
+    return np.unique(keys, return_inverse=True)[1]
+
+
+def _hedge_groups(
+    w: np.ndarray, p: np.ndarray, duration: np.ndarray, codes: np.ndarray, how: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Hedge volume and price for each group in ``codes``, broadcast to original values.
+    Vectorized equivalent of ``one_hedge`` on each group."""
+    weights = p * duration if how == "val" else duration
+    p_hedge = _wavg_groups(p, duration, codes)
+    w_hedge = _wavg_groups(w, weights, codes)
+    return w_hedge[codes], p_hedge[codes]
+
+
+def _wavg_groups(
+    values: np.ndarray, weights: np.ndarray, codes: np.ndarray
+) -> np.ndarray:
+    """Weighted average of ``values`` for each group in ``codes``. Same result as
+    ``tools.wavg.series`` on each group."""
+    weightsum = np.bincount(codes, weights)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.bincount(codes, values * weights) / weightsum
+    # Edge cases (sum of weights is 0, NaN values): use the full weighted average logic.
+    for code in np.flatnonzero(np.isclose(weightsum, 0) | np.isnan(result)):
+        mask = codes == code
+        result[code] = tools_wavg.series(pd.Series(values[mask]), weights[mask])
+    return result
+
+
+def cascade(
+    w: pd.Series,
+    p: pd.Series,
+    freqs: Iterable[str] = ("YS", "QS", "MS"),
+    how: str = "val",
+    peak_fn: tools_peakfn.PeakFunction = None,
+) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+    """
+    Make successive hedges of power timeseries, for given price timeseries. Each hedge
+    is done on the volume that remains open after the previous hedges.
+
+    Parameters
+    ----------
+    w : Series
+        Power timeseries with spot market frequency.
+    p: Series
+        Price timeseries with same frequency.
+    freqs : Iterable[str], optional (default: ('YS', 'QS', 'MS'))
+        Frequencies of the hedging products, in the order in which they are bought. Each
+        one of 'D' (days), 'MS' (months), 'QS' (quarters), 'YS' (years).
+    how : str, optional (Default: 'val')
+        Hedge-constraint. 'vol' for volumetric hedge, 'val' for value hedge.
+    peak_fn : PeakFunction, optional (default: None)
+        Function that returns boolean Series indicating if timestamps in index lie in
+        peak period. If None, hedge with base products. Ignored for daily products,
+        which are always base products.
+
+    Returns
+    -------
+    Dict[str, Tuple[Series, Series]]
+        For each frequency in ``freqs``: the power timeseries and price timeseries of the
+        hedge with that product. Like with ``hedge``, each only contains the timestamps
+        of the full delivery periods of that product.
+
+    Notes
+    -----
+    Identical to calling ``hedge`` once for each frequency (with ``peak_fn`` set to None
+    for daily products), each time on the volume that is still unhedged, but the price
+    and duration information is prepared only once.
+    """
+    freqs = list(freqs)
+    if not freqs:
+        raise ValueError("Parameter ``freqs`` must contain at least one frequency.")
+    if len(set(freqs)) != len(freqs):
+        raise ValueError(
+            f"Parameter ``freqs`` must not contain duplicates; got {freqs}."
+        )
+    peak_fns = {freq: None if freq == "D" else peak_fn for freq in freqs}
+    for freq in freqs:
+        _check_arguments(w, p, how, peak_fns[freq], freq)
+
+    # Handle possible units.
+    win, wunits = (w.pint.magnitude, w.pint.units) if hasattr(w, "pint") else (w, None)
+    pin, punits = (p.pint.magnitude, p.pint.units) if hasattr(p, "pint") else (p, None)
+
+    # Prepare values that are needed in every layer only once.
+    win, pin = tools_intersect.frames(win, pin)
+    i = win.index
+    openw = win.to_numpy(dtype=float, copy=True)
+    pvals = pin.to_numpy(dtype=float)
+    duration = tools_duration.index(i).pint.magnitude.to_numpy(dtype=float)
+    is_peak = None if peak_fn is None else np.asarray(peak_fn(i), dtype=bool)
+
+    layers = {}
+    for freq in freqs:
+        # Only hedge full periods; these form a contiguous block of rows.
+        i_trimmed = tools_trim.index(i, freq)
+        start = i.get_loc(i_trimmed[0]) if len(i_trimmed) else 0
+        rows = slice(start, start + len(i_trimmed))
+        if len(i_trimmed):
+            peak = is_peak[rows] if is_peak is not None and peak_fns[freq] else None
+            codes = _group_codes(i_trimmed, freq, peak)
+            w_hedge, p_hedge = _hedge_groups(
+                openw[rows], pvals[rows], duration[rows], codes, how
+            )
+            openw[rows] -= w_hedge
+        else:
+            w_hedge, p_hedge = np.array([]), np.array([])
+        wout = pd.Series(w_hedge, i_trimmed, name="w")
+        pout = pd.Series(p_hedge, i_trimmed, name="p")
+        # Handle possible units.
+        if wunits or punits:
+            wout, pout = wout.astype(f"pint[{wunits}]"), pout.astype(f"pint[{punits}]")
+        layers[freq] = (wout, pout)
+
+    return layers
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from . import freq as tools_freq
@@ -55,12 +56,18 @@ def indices(*idxs: pd.DatetimeIndex) -> pd.DatetimeIndex:
     if len(distinct_sod) != 1:
         raise ValueError(f"Indices must have equal start-of-day; got {distinct_sod}.")
 
+    # Most common case: indices are identical.
+    if all(i.equals(idxs[0]) for i in idxs[1:]):
+        return idxs[0]
+
     # Calculation is cumbersome: pandas DatetimeIndex.intersection not working correctly on timezone-aware indices (#46702)
-    values = set(idxs[0])
+    # Therefore, compare the (utc) integer values.
+    values = idxs[0].as_unit("ns").asi8
+    keep = np.ones(len(values), bool)
     for i in idxs[1:]:
-        values = values.intersection(set(i))
+        keep &= np.isin(values, i.as_unit("ns").asi8)
 
-    return pd.DatetimeIndex(sorted(list(values)), freq=freq, name=name, tz=tz)
+    return pd.DatetimeIndex(idxs[0][keep], freq=freq, name=name, tz=tz)
 
 
 def indices_flex(
@@ -155,20 +162,21 @@ def indices_flex(
         idxs = [index.normalize() for index in idxs]
 
     # Calculation is cumbersome: pandas DatetimeIndex.intersection not working correctly on timezone-aware indices (#46702)
-    values = set(idxs[0])
+    # Therefore, compare the integer values.
     # intersection is not working on datetimeindex with different freq->we need to use mask
+    keep = np.ones(len(idxs[0]), bool)
     for i in idxs[1:]:
-        values = values.intersection(set(i))
-    values = sorted(values)
+        keep &= np.isin(idxs[0].as_unit("ns").asi8, i.as_unit("ns").asi8)
+    values = idxs[0][keep]
 
     if len(values) == 0:
         return tuple([pd.DatetimeIndex([]) for _ in idxs])
 
     idxs_out = []
     for i in range(len(idxs)):
-        start = min(values)
+        start = values.min()
         # end = stamp(start, longest_freq._prefix)
-        end = max(values)
+        end = values.max()
         end = tools_right.stamp(end, longest_freq)
 
         if ignore_start_of_day is True:
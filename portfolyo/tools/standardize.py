@@ -2,6 +2,9 @@
 Standardizing series and dataframes to use as input for PfLine.
 """
 
+import weakref
+
+import numpy as np
 import pandas as pd
 from pytz import AmbiguousTimeError, NonExistentTimeError
 
@@ -161,6 +164,66 @@ def assert_frame_standardized(fr: Series_or_DataFrame) -> None:
     assert_index_standardized(fr.index)
 
 
+def assert_window_standardized(i: pd.DatetimeIndex) -> None:
+    """Assert that index, which is a contiguous part of a standardized index, is
+    standardized. Only the first and last elements need to be checked."""
+    _assert_notempty(i)
+    if tools_freq.up_or_down(i.freq, "15min") <= 0:  # quarterhour
+        _assert_firstminute(i, False)
+    if tools_freq.up_or_down(i.freq, "h") <= 0:  # hour or shorter
+        _assert_fulldays(i, False)
+
+
+def _assert_notempty(i: pd.DatetimeIndex) -> None:
+    if not len(i):
+        raise AssertionError("Index must have values; got empty index.")
+
+
+def _assert_firstminute(i: pd.DatetimeIndex, right: bool) -> None:
+    startminute = 15 if right else 0
+    if i[0].minute != startminute:
+        err = ("right-bound", "15 min past the") if right else ("", "at a full")
+        raise AssertionError(
+            f"The first element in an index with {err[0]} quarterhourly values must be {err[1]} hour; found {i[0]}."
+        )
+
+
+def _assert_fulldays(i: pd.DatetimeIndex, right: bool) -> None:
+    if not right:
+        start = i[0]
+        end = tools_right.stamp(i[-1], i.freq)
+    else:
+        start = tools_righttoleft.index(i)[0]
+        end = i[-1]
+    if start.time() != end.time():
+        raise AssertionError(
+            "An index must contain full days. For hourly-or-shorter values, this means "
+            f"that the start time of the first period ({start}) must equal the end time of the "
+            f"last period ({end}), which is not the case."
+        )
+
+
+# Indices that are known to be standardized (left-bound), by their id. Entries are
+# removed when the index is garbage collected. Only the identical index object is
+# skipped by ``assert_index_standardized``; portfolio lines mark their index, so that
+# timeseries taken from them (which share the index object) are not checked again.
+_STANDARDIZED: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def mark_standardized(i: pd.DatetimeIndex) -> None:
+    """Mark (left-bound) index as standardized, so that ``assert_index_standardized``
+    does not check it again. Only use on indices that are standardized by construction.
+    """
+    _STANDARDIZED[id(i)] = i
+
+
+def _walltime(i: pd.DatetimeIndex) -> np.ndarray:
+    """Local (wall clock) time of each timestamp in the index, as datetime64 values."""
+    if i.tz is not None:
+        i = i.tz_localize(None)
+    return i.values
+
+
 def assert_index_standardized(i: pd.DatetimeIndex, __right: bool = False):
     """Assert that index is standardized."""
 
@@ -177,26 +240,26 @@ def assert_index_standardized(i: pd.DatetimeIndex, __right: bool = False):
     #     )
     tools_freq.assert_freq_valid(freq)
 
+    # Already checked?
+    if not __right and _STANDARDIZED.get(id(i)) is i:
+        return
+
     # Check length.
-    if not len(i):
-        raise AssertionError("Index must have values; got empty index.")
+    _assert_notempty(i)
 
     # Check hour and minute.
+    wall = _walltime(i)
+    minute = (wall.astype("datetime64[m]") - wall.astype("datetime64[h]")).astype(int)
     if tools_freq.up_or_down(freq, "15min") <= 0:  # quarterhour
-        startminute = 15 if __right else 0
-        if i[0].minute != startminute:
-            err = ("right-bound", "15 min past the") if __right else ("", "at a full")
-            raise AssertionError(
-                f"The first element in an index with {err[0]} quarterhourly values must be {err[1]} hour; found {i[0]}."
-            )
+        _assert_firstminute(i, __right)
 
-        if any(not_ok := [ts.minute not in (0, 15, 30, 45) for ts in i]):
+        if (not_ok := minute % 15 != 0).any():
             raise AssertionError(
                 "In an index with quarterhourly values, all timestamps (all periods) should"
                 f" start at a full quarter-hour; found {i[not_ok]}."
             )
     else:  # longer than quarterhour
-        if any(not_ok := i.minute != 0):
+        if (not_ok := minute != 0).any():
             raise AssertionError(
                 "In an index with hourly-or-longer values, all timestamps (all periods) should"
                 f" start at a full hour; found {i[not_ok]}."
@@ -204,23 +267,13 @@ def assert_index_standardized(i: pd.DatetimeIndex, __right: bool = False):
 
     # Check time-of-day.
     if tools_freq.up_or_down(freq, "h") <= 0:  # hour or shorter
-        if not __right:
-            start = i[0]
-            end = tools_right.stamp(i[-1], i.freq)
-        else:
-            start = tools_righttoleft.index(i)[0]
-            end = i[-1]
-        if start.time() != end.time():
-            raise AssertionError(
-                "An index must contain full days. For hourly-or-shorter values, this means "
-                f"that the start time of the first period ({start}) must equal the end time of the "
-                f"last period ({end}), which is not the case."
-            )
+        _assert_fulldays(i, __right)
     else:  # days or longer
-        if not len(times := set(i.time)) == 1:
+        timeofday = wall - wall.astype("datetime64[D]")
+        if (timeofday != timeofday[0]).any():
             raise AssertionError(
                 "In an index with daily-or-longer values, all timestamps (all periods) should"
-                f" start at the same time. Found multiple times: {times}."
+                f" start at the same time. Found multiple times: {set(i.time)}."
             )
 
     # Check day-of-X.
@@ -232,8 +285,11 @@ def assert_index_standardized(i: pd.DatetimeIndex, __right: bool = False):
             period, not_ok = "quarter", ~i.is_quarter_start
         elif freq == "YS":
             period, not_ok = "year", ~i.is_year_start
-        if any(not_ok):
+        if not_ok.any():
             raise AssertionError(
                 f"In an index with {period}ly values, all timestamps (all {period}s) should"
                 f" fall on the first day of a {period}; found {i[not_ok]}."
             )
+
+    if not __right:
+        mark_standardized(i)
@@ -2,9 +2,11 @@
 Working with pint units.
 """
 
+import functools
 from pathlib import Path
-from typing import Tuple, overload
+from typing import List, Tuple, overload
 from .types import Series_or_DataFrame
+import numpy as np
 import pandas as pd
 import pint
 import pint_pandas
@@ -36,6 +38,8 @@ NAMES_AND_UNITS = {
     "nodim": ureg.dimensionless,
 }
 
+_DIMENSIONLESS = ureg.dimensionless
+
 
 def to_name(unit: pint.Unit) -> str:
     """Find the standard column name belonging to unit `unit`. Checks on dimensionality,
@@ -53,6 +57,74 @@ def from_name(name: str) -> pint.Unit:
     raise ValueError(f"No standard unit found for name '{name}'.")
 
 
+@functools.lru_cache(maxsize=None)
+def pinttype(unit: str | pint.Unit) -> pint_pandas.PintType:
+    """Pandas data type for values with unit ``unit``. Cached, to avoid formatting and
+    parsing the unit on every conversion."""
+    return pint_pandas.PintType(unit)
+
+
+@functools.lru_cache(maxsize=None)
+def factor(unit_from: pint.Unit, unit_to: pint.Unit) -> float:
+    """Factor with which to multiply magnitudes in ``unit_from`` to get magnitudes in
+    ``unit_to``. Cached; only for units without offset (i.e., not for temperatures).
+    Raises pint.DimensionalityError if the units are not compatible."""
+    return Q_(1.0, unit_from).to(unit_to).magnitude
+
+
+def convert(s: pd.Series, unit: pint.Unit) -> pd.Series:
+    """Express pint-Series in ``unit``, using a cached conversion factor. Float-Series
+    are assumed to already be in ``unit``."""
+    if not isinstance(s.dtype, pint_pandas.PintType):
+        magnitudes = s.to_numpy(dtype=float)  # (.astype() converts element-wise)
+    else:
+        magnitudes = s.pint.magnitude.to_numpy(dtype=float) * factor(s.pint.units, unit)
+    values = PA_(magnitudes, dtype=pinttype(unit))
+    return pd.Series(values, s.index, name=s.name)
+
+
+def convert_quantities(
+    values: np.ndarray, unit: pint.Unit = None
+) -> Tuple[np.ndarray, List[pint.Unit]]:
+    """Get magnitudes of an array of quantities, expressed in a single unit.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Object-array of quantities.
+    unit : pint.Unit, optional (default: None)
+        Unit in which to express the magnitudes. If None, use the base units of each
+        quantity.
+
+    Returns
+    -------
+    np.ndarray
+        Float-array with the magnitudes.
+    List[pint.Unit]
+        The distinct units in which the magnitudes are expressed.
+
+    Notes
+    -----
+    The quantities are grouped by unit, so that each group is converted in one go.
+    Raises pint.DimensionalityError if ``unit`` is given and not all quantities can be
+    converted into it.
+    """
+    magnitudes = np.array([v.magnitude for v in values], dtype=float)
+    # HACK: for speed, group on the (cheaply hashed and compared) unit containers.
+    lookup = {}
+    codes = np.array([lookup.setdefault(v._units, len(lookup)) for v in values])
+    uniques = [Unit(container) for container in lookup]
+    units = []
+    for code, u in enumerate(uniques):
+        mask = codes == code
+        group = Q_(magnitudes[mask], u)
+        group = group.to_base_units() if unit is None else group.to(unit)
+        magnitudes[mask] = group.magnitude
+        if group.units not in units:
+            units.append(group.units)
+    return magnitudes, units
+
+
 @overload
 def defaultunit(val: int | float) -> float:
     ...
@@ -94,18 +166,21 @@ def defaultunit(
     elif isinstance(val, float):
         return val
     elif isinstance(val, pint.Quantity):
-        if val.units == ureg.Unit("dimensionless"):
+        if val.units == _DIMENSIONLESS:
             return val.magnitude
         return val.to_base_units()
     elif isinstance(val, pd.Series):
         if isinstance(val.dtype, pint_pandas.PintType):
-            if val.pint.units == ureg.Unit("dimensionless"):
+            if val.pint.units == _DIMENSIONLESS:
                 return val.astype(float)
             return val.pint.to_base_units()
         elif pd.api.types.is_object_dtype(val.dtype) and isinstance(val.iloc[0], Q_):
             try:
                 unit = val.iloc[0].to_base_units().units
-                pintseries = val.astype(f"pint[{unit}]")
+                magnitudes, _ = convert_quantities(val.values, unit)
+                pintseries = pd.Series(
+                    magnitudes, val.index, dtype=f"pint[{unit}]", name=val.name
+                )
                 return defaultunit(pintseries)
             except pint.DimensionalityError:  # not all have same dimension
                 # convert to base units instead.
@@ -194,7 +269,9 @@ def avoid_frame_of_objects(fr: Series_or_DataFrame) -> Series_or_DataFrame:
             return fr
         # We may have a series of pint quantities. Convert to pint-series, if possible.
         try:
-            return fr.astype(f"pint[{fr.iloc[0].units}]")
+            unit = fr.iloc[0].units
+            magnitudes, _ = convert_quantities(fr.values, unit)
+            return pd.Series(magnitudes, fr.index, dtype=f"pint[{unit}]", name=fr.name)
         except pint.DimensionalityError as e:
             dimensions = {v.dimensionality for v in fr.values}
             raise pint.DimensionalityError(
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 from .. import tools
 from ..core import pfstate
-from ..core.pfline import PfLine, create
+from ..core.pfline import PfLine
+from ..core.shared import validation
 from ..core.pfline.enums import Structure
 from ..core.pfstate import PfState
 
@@ -70,6 +72,9 @@ def concat_pflines(pfls: Iterable[PfLine]) -> PfLine:
     is done on a name-by-name basis.
 
     Concatenation returns the same result regardless of input order.
+
+    Only the joins between the portfolio lines are verified, not the data they contain.
+    All values are copied into one array per column (and per child) at once.
     """
     if len(pfls) < 2:
         raise NotImplementedError(
@@ -87,43 +92,71 @@ def concat_pflines(pfls: Iterable[PfLine]) -> PfLine:
         )
     # we can concatenate only pflines of the same type: nested of flat
     # with this test and check whether pfls are the same types and they have the same number of children
-    if len({pfl.structure for pfl in pfls}) != 1:
-        raise TypeError("Not possible to concatenate PfLines of different structures.")
-    if pfls[0].structure is Structure.NESTED:
-        child_names = pfls[0].children.keys()
-        for pfl in pfls:
-            diffs = set(child_names) ^ set(pfl.children.keys())
-            if len(diffs) != 0:
-                raise TypeError(
-                    "Not possible to concatenate PfLines with different children names."
-                )
+    _assert_same_structure(pfls)
     # If we reach here, all pfls have same kind, same number and names of children.
 
     # concat(a,b) and concat(b,a) should give the same result:
     sorted_pfls = sorted(pfls, key=lambda pfl: pfl.index[0])
-    if pfls[0].structure is Structure.FLAT:
-        # create flat dataframe of parent
-        dataframes_flat = [pfl.df for pfl in sorted_pfls]
-        # concatenate dataframes into one
-        concat_data = pd.concat(dataframes_flat, axis=0)
-        try:
-            # Call create.flatpfline() and catch any ValueError
-            return create.flatpfline(concat_data)
-        except ValueError as e:
-            # Handle the error
+    freq = sorted_pfls[0].index.freq
+    for pfl1, pfl2 in zip(sorted_pfls[:-1], sorted_pfls[1:]):
+        if tools.right.stamp(pfl1.index[-1], freq) != pfl2.index[0]:
             raise ValueError(
                 "Error by creating PfLine. PfLine is either not gapless or has overlaps"
-            ) from e
+            )
+    # Only the joins needed checking; the data in each portfolio line is correct.
+    with validation.trusted():
+        return _concat_sorted(sorted_pfls)
+
+
+def _assert_same_structure(pfls: Iterable[PfLine]) -> None:
+    """Assert that portfolio lines, and their children, are all flat or all nested with
+    the same children names."""
+    if len({pfl.structure for pfl in pfls}) != 1:
+        raise TypeError("Not possible to concatenate PfLines of different structures.")
+    if pfls[0].structure is Structure.FLAT:
+        return
+    child_names = pfls[0].children.keys()
+    for pfl in pfls:
+        diffs = set(child_names) ^ set(pfl.children.keys())
+        if len(diffs) != 0:
+            raise TypeError(
+                "Not possible to concatenate PfLines with different children names."
+            )
+    for cname in child_names:
+        _assert_same_structure([pfl.children[cname] for pfl in pfls])
+
+
+def _magnitudes(s: pd.Series, unit: tools.unit.Unit) -> np.ndarray:
+    """Magnitudes of pint-series ``s``, in unit ``unit``."""
+    # HACK: access values directly, which is faster than via the .pint accessor.
+    magnitudes = s.array.numpy_data
+    if s.dtype.units != unit:
+        magnitudes = magnitudes * tools.unit.factor(s.dtype.units, unit)
+    return magnitudes
+
+
+def _concat_sorted(pfls: Iterable[PfLine]) -> PfLine:
+    """Concatenate compatible portfolio lines, which are sorted and gapless."""
+    if pfls[0].structure is Structure.FLAT:
+        # Copy values into one array per column.
+        index = pd.date_range(
+            pfls[0].index[0],
+            periods=sum(len(pfl.index) for pfl in pfls),
+            freq=pfls[0].index.freq,
+        )
+        data = {}
+        for col, dtype in pfls[0].df.dtypes.items():
+            arrays = [_magnitudes(pfl.df[col], dtype.units) for pfl in pfls]
+            data[col] = pd.Series(tools.unit.PA_(np.concatenate(arrays), dtype), index)
+        return pfls[0].__class__(pd.DataFrame(data, copy=False))
+
     child_data = {}
     child_names = pfls[0].children.keys()
     for cname in child_names:
         # for every name in children need to concatenate elements
-        child_values = [pfl.children[cname] for pfl in sorted_pfls]
-        child_data[cname] = concat_pflines(child_values)
-
-    # create pfline from dataframes: ->
-    # call the constructor of pfl to check check gaplesnes and overplap
-    return create.nestedpfline(child_data)
+        child_values = [pfl.children[cname] for pfl in pfls]
+        child_data[cname] = _concat_sorted(child_values)
+    return pfls[0].__class__(child_data)
 
 
 def concat_pfstates(pfss: Iterable[PfState]) -> PfState:
@@ -147,4 +180,6 @@ def concat_pfstates(pfss: Iterable[PfState]) -> PfState:
     offtakevolume = concat_pflines([pfs.offtakevolume for pfs in pfss])
     sourced = concat_pflines([pfs.sourced for pfs in pfss])
     unsourcedprice = concat_pflines([pfs.unsourcedprice for pfs in pfss])
-    return pfstate.PfState(offtakevolume, unsourcedprice, sourced)
+    # Indices are identical by construction.
+    with validation.trusted():
+        return pfstate.PfState(offtakevolume, unsourcedprice, sourced)
@@ -628,3 +628,20 @@ def test_interop(data_in, expected_io, expected_io2):
 
     result_io3 = result_io2.to_timeseries()
     assert result_io3 == result_io2  # repeated application of intersection does nothing
+
+
+def test_interop_seriesofquantities():
+    """Test if series of quantities in different units is converted correctly."""
+    units = ["MW", "kW", "GW"]
+    quantities = [Q_(v, units[k % 3]) for k, v in enumerate(val1)]
+    s_in = pd.Series(quantities, idx1)
+    expected = pd.Series([q.to("MW").m for q in quantities], idx1, dtype="pint[MW]")
+    result = io.InOp.from_data({"w": s_in})
+    pd.testing.assert_series_equal(result.w.pint.to("MW"), expected, check_names=False)
+
+
+def test_interop_seriesofquantities_nonuniform():
+    """Test if series of quantities in different dimensions raises error."""
+    s_in = pd.Series([Q_(v, ["MW", "MWh"][k % 2]) for k, v in enumerate(val1)], idx1)
+    with pytest.raises(ValueError, match="uniform unit"):
+        _ = io.InOp.from_data({"w": s_in})
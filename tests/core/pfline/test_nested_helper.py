@@ -157,3 +157,56 @@ def test_makemapping(input: Any, expected: Mapping):
             assert all(result_val == expected_val)
         else:
             assert result_val == expected_val
+
+
+@pytest.mark.parametrize("freq", ["15min", "D", "MS"])
+@pytest.mark.parametrize("columns", ["w", "q", "p", "r", "wp", "qr", "pr", "wqpr"])
+def test_children_from_wide(freq: str, columns: str):
+    """Test if children created in one go from wide dataframe are same as those created
+    one by one."""
+    i = dev.get_index(freq, "Europe/Berlin")
+    pfls = {n: dev.get_flatpfline(i, Kind.COMPLETE) for n in ["a", "b", "c"]}
+    df = pd.concat(
+        {
+            n: pfl.df[list(columns)].pint.dequantify().droplevel(1, axis=1)
+            for n, pfl in pfls.items()
+        },
+        axis=1,
+    )
+
+    expected = nested_helper._children(nested_helper._mapping(df))
+    assert (result := nested_helper._children_from_wide(df)) is not None
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({("a", "w"): [1.0, 2.0], ("b", "q"): [1.0, 2.0]}),
+        pd.DataFrame({("a", "w"): [1, 2], ("b", "w"): [1, 2]}),
+        pd.DataFrame({("a", "w"): [1.0, 2.0], ("b", "x"): [1.0, 2.0]}),
+        pd.DataFrame({"a": [1.0, 2.0], "b": [1.0, 2.0]}),
+        pd.DataFrame({("a", "w"): pd.Series([1.0, 2.0], dtype="pint[MW]")}),
+    ],
+)
+def test_children_from_wide_notapplicable(df: pd.DataFrame):
+    """Test if other dataframes are left to be handled one child at a time."""
+    assert nested_helper._children_from_wide(df) is None
+
+
+def test_children_from_wide_inconsistent():
+    """Test if inconsistent values in wide dataframe raise error."""
+    i = dev.get_index("D", "Europe/Berlin")
+    df = pd.DataFrame(
+        {("a", "w"): 1.0, ("a", "q"): 24.0, ("b", "w"): 1.0, ("b", "q"): 30.0}, i
+    )
+    with pytest.raises(ValueError, match="w and q are not consistent"):
+        _ = nested_helper._children_from_wide(df)
+
+
+def test_children_from_wide_name():
+    """Test if invalid child names raise error."""
+    i = dev.get_index("D", "Europe/Berlin")
+    df = pd.DataFrame({("w", "w"): 1.0, ("b", "w"): 1.0}, i)
+    with pytest.raises(ValueError, match="Name cannot be"):
+        _ = nested_helper._children_from_wide(df)
@@ -0,0 +1,82 @@
+"""Test appending portfolio lines and states to each other."""
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import Kind, dev
+
+
+@pytest.mark.parametrize("kind", [Kind.VOLUME, Kind.PRICE, Kind.REVENUE, Kind.COMPLETE])
+@pytest.mark.parametrize("levels", [1, 2, 3])
+@pytest.mark.parametrize("freq", ["15min", "D", "MS"])
+def test_pfline_append(levels: int, kind: Kind, freq: str):
+    """Test if appended portfolio line equals the original one."""
+    pfl = dev.get_pfline(dev.get_index(freq, _seed=1), kind, levels, _seed=1)
+    split = pfl.index[len(pfl.index) // 2]
+    split = split.floor("D") if freq == "15min" else split
+    result = pfl.slice[:split].append(pfl.slice[split:])
+    assert result == pfl
+    assert type(result) is type(pfl)
+    assert result.index.freq == pfl.index.freq
+
+
+def test_pfline_append_repeatedly():
+    """Test if portfolio line can be appended to many times, also from a previous one."""
+    i = pd.date_range("2024", freq="h", periods=24 * 60, tz="Europe/Berlin")
+    pfl = dev.get_flatpfline(i, Kind.COMPLETE)
+    days = pd.date_range("2024-01-11", "2024-03-01", freq="D", tz="Europe/Berlin")
+
+    result = pfl.slice[:"2024-01-11"]
+    for start, end in zip(days[:-1], days[1:]):
+        result = result.append(pfl.slice[start:end])
+    assert result == pfl
+
+    # Earlier portfolio lines are not changed by appending to them again.
+    first = pfl.slice[:"2024-01-11"]
+    second = first.append(pfl.slice["2024-01-11":"2024-01-12"])
+    other = first.append(pfl.slice["2024-01-11":"2024-01-12"] * 2)
+    assert second == pfl.slice[:"2024-01-12"]
+    assert other.slice["2024-01-11":] == pfl.slice["2024-01-11":"2024-01-12"] * 2
+    assert first == pfl.slice[:"2024-01-11"]
+
+
+def test_pfline_append_data():
+    """Test if data, that is not yet a portfolio line, can be appended."""
+    i = pd.date_range("2024", freq="D", periods=20)
+    pfl = pf.PfLine(pd.Series(10.0, i[:10], dtype="pint[MW]"))
+    result = pfl.append(pd.Series(10.0, i[10:], dtype="pint[MW]"))
+    assert result == pf.PfLine(pd.Series(10.0, i, dtype="pint[MW]"))
+
+
+@pytest.mark.parametrize(
+    "other,error",
+    [
+        (lambda pfl: pfl.slice["2024-01-12":], ValueError),  # gap
+        (lambda pfl: pfl.slice["2024-01-10":], ValueError),  # overlap
+        (lambda pfl: pfl.slice["2024-01-11":].volume, TypeError),
+        (lambda pfl: pfl.slice["2024-01-11":].asfreq("D"), TypeError),
+        (lambda pfl: pf.PfLine({"a": pfl.slice["2024-01-11":]}), TypeError),
+    ],
+)
+def test_pfline_append_error(other, error):
+    """Test if incompatible portfolio lines cannot be appended."""
+    i = pd.date_range("2024", freq="h", periods=24 * 20, tz="Europe/Berlin")
+    pfl = dev.get_flatpfline(i, Kind.COMPLETE)
+    with pytest.raises(error):
+        pfl.slice[:"2024-01-11"].append(other(pfl))
+
+
+def test_pfline_append_childnames():
+    """Test if nested portfolio lines must have the same children."""
+    pfl = dev.get_nestedpfline(pd.date_range("2024", freq="D", periods=20))
+    other = pf.PfLine({"x": pfl.slice["2024-01-11":].flatten()})
+    with pytest.raises(TypeError):
+        pfl.slice[:"2024-01-11"].append(other)
+
+
+def test_pfstate_append():
+    """Test if appended portfolio state equals the original one."""
+    pfs = dev.get_pfstate(pd.date_range("2024", freq="D", periods=60))
+    result = pfs.slice[:"2024-02"].append(pfs.slice["2024-02":])
+    assert result == pfs
@@ -0,0 +1,77 @@
+"""Test if portfolio line can be saved to and loaded from arrow and parquet formats."""
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import Kind, dev
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["15min", "h", "D", "MS"])
+@pytest.mark.parametrize("kind", [Kind.VOLUME, Kind.PRICE, Kind.REVENUE, Kind.COMPLETE])
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_pfline_arrow_roundtrip(levels: int, kind: Kind, freq: str, tz: str):
+    """Test if portfolio line is recreated from arrow table."""
+    i = dev.get_index(freq, tz, _seed=2)
+    pfl = dev.get_pfline(i, nlevels=levels, kind=kind, _seed=2)
+    result = pf.from_arrow(pfl.to_arrow())
+    assert result == pfl
+    assert type(result) is type(pfl)
+    pd.testing.assert_index_equal(result.index, pfl.index)
+    assert result.index.freq == pfl.index.freq
+
+
+def test_pfline_arrow_table():
+    """Test if values are stored as floats, in default units."""
+    i = pd.date_range("2024", freq="D", periods=10, tz="Europe/Berlin")
+    a = pd.DataFrame({"w": 10.0, "p": 50.0}, i)
+    pfl = pf.PfLine({"a": a, "b": pd.DataFrame({"q": 24.0, "p": 10.0}, i)})
+    tbl = pfl.to_arrow()
+    assert tbl.column_names == ["ts_left", *(f"{c}/{x}" for c in "ab" for x in "wqpr")]
+    assert tbl.column("a/r").to_pylist() == [12_000.0] * 10
+    assert tbl.column("b/w").to_pylist()[0] == 1.0
+
+
+def test_pfline_parquet(tmp_path):
+    """Test if portfolio line is recreated from parquet file."""
+    pfl = dev.get_pfline(nlevels=3, kind=Kind.COMPLETE)
+    pfl.to_parquet(tmp_path / "pfl.parquet")
+    assert pf.read_parquet(tmp_path / "pfl.parquet") == pfl
+
+
+def test_pfline_arrow_childnames():
+    """Test if children with a '/' in their name can be stored."""
+    i = pd.date_range("2024", freq="MS", periods=12)
+    pfl = pf.PfLine(pd.DataFrame({"w": 1.0}, i))
+    nested = pf.PfLine({"a/b": pfl, "a": {"b": pfl * 2, "c": pfl}})
+    result = pf.from_arrow(nested.to_arrow())
+    assert result == nested
+    assert result["a/b"] == pfl
+    assert result["a"]["b"] == pfl * 2
+
+
+def test_pfline_arrow_nometadata():
+    """Test if error is raised for table that was not saved by portfolyo."""
+    tbl = dev.get_pfline().to_arrow()
+    with pytest.raises(ValueError):
+        pf.from_arrow(tbl.replace_schema_metadata(None))
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+@pytest.mark.parametrize("levels", [1, 3])
+def test_pfline_feather(tmp_path, levels: int, memory_map: bool):
+    """Test if portfolio line is recreated from feather file."""
+    pa = pytest.importorskip("pyarrow")
+    i = dev.get_index("15min", startdate="2020-01-01", periods=8784)
+    pfl = dev.get_pfline(i, nlevels=levels, kind=Kind.COMPLETE)
+    pfl.to_feather(tmp_path / "pfl.feather")
+    allocated = pa.total_allocated_bytes()
+    result = pf.read_feather(tmp_path / "pfl.feather", memory_map=memory_map)
+    assert result == pfl
+    # Memory-mapped values are not read into (arrow's) memory.
+    assert (pa.total_allocated_bytes() == allocated) is memory_map
+    assert result.slice["2020-03":] == pfl.slice["2020-03":]
+    assert result.asfreq("MS") == pfl.asfreq("MS")
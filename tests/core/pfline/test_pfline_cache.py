@@ -0,0 +1,85 @@
+"""Test caching of method results on portfolio lines and states."""
+
+import gc
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import dev
+
+INDEX = pd.date_range("2024", freq="h", periods=24 * 60, tz="Europe/Berlin")
+
+
+@pytest.fixture(autouse=True)
+def cache_results(monkeypatch):
+    monkeypatch.setattr(pf.settings, "cache_results", True)
+    pf.clear_result_cache()
+    yield
+    pf.clear_result_cache()
+
+
+@pytest.mark.parametrize("nested", [False, True])
+def test_asfreq_cached(nested: bool):
+    """Test if result of asfreq is stored and reused."""
+    pfl = dev.get_nestedpfline(INDEX) if nested else dev.get_flatpfline(INDEX)
+    result = pfl.asfreq("MS")
+    misses = pf.result_cache_info()["misses"]
+    assert pfl.asfreq("MS") is result
+    assert pfl.asfreq(freq="MS") is result
+    assert pf.result_cache_info()["hits"] >= 2
+    assert pf.result_cache_info()["misses"] == misses
+    assert pfl.asfreq("D") is not result
+
+
+def test_po_hedgewith_cached():
+    """Test if results of po and hedge_with are stored and reused."""
+    pfl, prices = dev.get_flatpfline(INDEX), dev.get_flatpfline(INDEX, pf.Kind.PRICE)
+    po = pfl.po(pf.germanpower_peakfn)
+    po2 = pfl.po(pf.germanpower_peakfn)
+    pd.testing.assert_frame_equal(po2, po)
+    po2.iloc[0, 0] = None  # mutating the returned dataframe does not affect the cache
+    pd.testing.assert_frame_equal(pfl.po(pf.germanpower_peakfn), po)
+    hedge = pfl.hedge_with(prices)
+    assert pfl.hedge_with(prices) is hedge
+    assert pfl.hedge_with(prices, "vol") is not hedge
+    assert pf.result_cache_info()["hits"] == 3
+
+
+def test_pfstate_asfreq_cached():
+    """Test if result of asfreq is stored and reused for portfolio states."""
+    pfs = dev.get_pfstate(INDEX)
+    assert pfs.asfreq("MS") is pfs.asfreq("MS")
+
+
+def test_cache_optin(monkeypatch):
+    """Test if nothing is stored if caching is not turned on."""
+    monkeypatch.setattr(pf.settings, "cache_results", False)
+    pfl = dev.get_flatpfline(INDEX)
+    assert pfl.asfreq("MS") is not pfl.asfreq("MS")
+    assert pf.result_cache_info()["entries"] == 0
+
+
+def test_cache_lifetime():
+    """Test if results are removed when the object is removed."""
+    pfl = dev.get_flatpfline(INDEX)
+    _ = pfl.asfreq("MS")
+    assert pf.result_cache_info()["entries"] == 1
+    del pfl
+    gc.collect()
+    assert pf.result_cache_info()["entries"] == 0
+    assert pf.result_cache_info()["nbytes"] == 0
+
+
+def test_cache_budget(monkeypatch):
+    """Test if least-recently used results are removed to stay within the budget."""
+    pfl = dev.get_flatpfline(INDEX)
+    size = pf.core.shared.cache.nbytes(pfl.asfreq("D"))
+    pf.clear_result_cache()
+    monkeypatch.setattr(pf.settings, "cache_results_maxbytes", int(size * 1.5))
+    daily = pfl.asfreq("D")
+    _ = pfl.asfreq("MS")  # small
+    assert pfl.asfreq("D") is daily  # hit; now most-recently used
+    _ = pfl.volume.asfreq("D")  # does not fit together with `daily`
+    assert pf.result_cache_info()["nbytes"] <= size * 1.5
+    assert pfl.asfreq("D") is not daily
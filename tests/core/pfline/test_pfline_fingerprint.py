@@ -0,0 +1,59 @@
+"""Test content fingerprints of portfolio lines and states."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import Kind, dev
+
+INDEX = pd.date_range("2024", freq="D", periods=60, tz="Europe/Berlin")
+
+
+@pytest.mark.parametrize("kind", [Kind.VOLUME, Kind.PRICE, Kind.REVENUE, Kind.COMPLETE])
+def test_fingerprint_flat(kind: Kind):
+    """Test if fingerprint depends on content only."""
+    pfl = dev.get_flatpfline(INDEX, kind)
+    same = pf.PfLine(pfl.df.copy())
+    assert same is not pfl
+    assert same.fingerprint == pfl.fingerprint
+    assert pfl.fingerprint is pfl.fingerprint  # calculated once
+    assert (pfl * 2).fingerprint != pfl.fingerprint
+    assert pfl.slice[:"2024-02"].fingerprint != pfl.fingerprint
+
+
+def test_fingerprint_nanandzero():
+    """Test if NaN and signed zeros do not affect the fingerprint."""
+    values1 = np.array([0.0, np.nan, 1.0] * 20)
+    values2 = np.array([-0.0, -np.nan, 1.0] * 20)
+    pfl1 = pf.PfLine(pd.Series(values1, INDEX, dtype="pint[Eur/MWh]"))
+    pfl2 = pf.PfLine(pd.Series(values2, INDEX, dtype="pint[Eur/MWh]"))
+    assert pfl1.fingerprint == pfl2.fingerprint
+
+
+def test_fingerprint_nested():
+    """Test if fingerprint of nested portfolio line depends on children and names."""
+    a, b = dev.get_flatpfline(INDEX), dev.get_flatpfline(INDEX)
+    pfl = pf.PfLine({"a": a, "b": b})
+    assert pf.PfLine({"b": b, "a": a}).fingerprint == pfl.fingerprint
+    assert pf.PfLine({"a": a, "c": b}).fingerprint != pfl.fingerprint
+    assert pf.PfLine({"a": b, "b": a}).fingerprint != pfl.fingerprint
+    assert pfl.flatten().fingerprint != pfl.fingerprint
+
+
+def test_fingerprint_equality():
+    """Test if objects with equal fingerprint are equal."""
+    pfl = dev.get_nestedpfline(INDEX)
+    same = pf.PfLine({name: child.df.copy() for name, child in pfl.items()})
+    assert same.fingerprint == pfl.fingerprint
+    assert same == pfl
+
+
+def test_fingerprint_pfstate():
+    """Test if fingerprint of portfolio state depends on content only."""
+    pfs = dev.get_pfstate(INDEX)
+    same = pf.PfState(pfs.offtakevolume, pfs.unsourcedprice, pfs.sourced)
+    assert same.fingerprint == pfs.fingerprint
+    assert same == pfs
+    other = pf.PfState(pfs.offtakevolume * 2, pfs.unsourcedprice, pfs.sourced)
+    assert other.fingerprint != pfs.fingerprint
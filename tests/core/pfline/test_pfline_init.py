@@ -299,3 +299,39 @@ def test_equal_sod(freq: str):
     s_pint = s.astype("pint[MW]")
     with pytest.raises(ValueError):
         pf.PfLine(s_pint)
+
+
+@pytest.mark.parametrize("as_df", [True, False])
+def test_init_nested_noflatattempt(monkeypatch, as_df: bool):
+    """Test if nested data is not first tried as flat portfolio line."""
+    i = dev.get_index("D", "Europe/Berlin")
+    pfls = {"a": dev.get_flatpfline(i), "b": dev.get_flatpfline(i)}
+    data = {
+        "a": pfls["a"].df.pint.dequantify().droplevel(1, axis=1),
+        "b": pfls["b"].df.pint.dequantify().droplevel(1, axis=1),
+    }
+    if as_df:
+        data = pd.concat(data, axis=1)
+    expected = create.nestedpfline(data)
+
+    attempted = []
+
+    def flatpfline(data_):
+        attempted.append(data_)
+        return original(data_)
+
+    original = create.flatpfline
+    monkeypatch.setattr(create, "flatpfline", flatpfline)
+    result = create.pfline(data)
+    assert result == expected
+    assert not any(a is data for a in attempted)
+
+
+def test_init_errormessage():
+    """Test if error message mentions both attempts, in fixed order."""
+    i = dev.get_index("D", "Europe/Berlin")
+    data = {"a": pd.Series(1.0, i), "b": pd.Series(1.0, i)}
+    with pytest.raises(ValueError) as e:
+        _ = create.pfline(data)
+    message = e.value.args[0]
+    assert message.index("- flat:") < message.index("- nested:")
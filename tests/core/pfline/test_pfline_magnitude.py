@@ -0,0 +1,61 @@
+"""Test calculations with portfolio lines in magnitude mode."""
+
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import Kind, dev
+from portfolyo.core.shared import magnitude
+
+INDEX = pd.date_range("2024", freq="h", periods=24 * 30, tz="Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        lambda a, b: a + b,
+        lambda a, b: a - b,
+        lambda a, b: a.volume + b.volume,
+        lambda a, b: a.volume * b.price,
+        lambda a, b: a.price * b.volume,
+        lambda a, b: a * 2.5,
+        lambda a, b: -a,
+        lambda a, b: a / 4,
+        lambda a, b: a.volume * pd.Series(0.5, INDEX),
+        lambda a, b: a.revenue / b.volume,
+    ],
+)
+@pytest.mark.parametrize("nested", [False, True])
+def test_magnitudemode_sameresult(fn: Callable, nested: bool):
+    """Test if calculations give the same result in magnitude mode."""
+    if nested:
+        a, b = dev.get_nestedpfline(INDEX), dev.get_nestedpfline(INDEX)
+    else:
+        a, b = dev.get_flatpfline(INDEX), dev.get_flatpfline(INDEX)
+    expected = fn(a, b)
+    with pf.magnitude_mode():
+        result = fn(a, b)
+    assert result == expected
+
+
+def test_magnitudemode_dataframe():
+    """Test if dataframes are exported without units in magnitude mode, unless asked."""
+    pfl = dev.get_flatpfline(INDEX, Kind.COMPLETE)
+    with pf.magnitude_mode():
+        df = pfl.dataframe()
+        df_units = pfl.dataframe(has_units=True)
+    assert all(dtype == float for dtype in df.dtypes)
+    pd.testing.assert_frame_equal(df_units, pfl.dataframe())
+    pd.testing.assert_frame_equal(df, pfl.dataframe(has_units=False))
+
+
+def test_magnitudemode_context():
+    """Test if magnitude mode is only active inside the context."""
+    assert not magnitude.active()
+    with pytest.raises(ZeroDivisionError):
+        with pf.magnitude_mode():
+            assert magnitude.active()
+            _ = 1 / 0
+    assert not magnitude.active()
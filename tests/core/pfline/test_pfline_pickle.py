@@ -0,0 +1,46 @@
+"""Test if portfolio line can be pickled and unpickled."""
+
+import pickle
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+from portfolyo import Kind, dev
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["15min", "D", "MS"])
+@pytest.mark.parametrize("kind", [Kind.VOLUME, Kind.PRICE, Kind.REVENUE, Kind.COMPLETE])
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_pfline_pickle_roundtrip(levels: int, kind: Kind, freq: str, tz: str):
+    """Test if portfolio line is recreated when unpickling."""
+    i = dev.get_index(freq, tz, _seed=2)
+    pfl = dev.get_pfline(i, nlevels=levels, kind=kind, _seed=2)
+    result = pickle.loads(pickle.dumps(pfl))
+    assert result == pfl
+    assert type(result) is type(pfl)
+    pd.testing.assert_index_equal(result.index, pfl.index)
+    assert result.index.freq == pfl.index.freq
+
+
+def test_pfline_pickle_outofband():
+    """Test if only the values of the flat portfolio lines are passed as buffers."""
+    i = pd.date_range("2024", freq="D", periods=10, tz="Europe/Berlin")
+    a = pd.DataFrame({"w": 10.0, "p": 50.0}, i)
+    pfl = pf.PfLine({"a": a, "b": pd.DataFrame({"q": 24.0, "p": 10.0}, i)})
+    buffers = []
+    data = pickle.dumps(pfl, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 8  # 4 columns in each child; none for the aggregate
+    assert pickle.loads(data, buffers=buffers) == pfl
+
+
+def test_pfline_pickle_nocache():
+    """Test if cached values are not pickled."""
+    pfl = dev.get_flatpfline(pd.date_range("2024", freq="D", periods=10))
+    pfl.fingerprint
+    assert "fingerprint" not in pickle.loads(pickle.dumps(pfl)).__dict__
+    appended = pfl.append(
+        dev.get_flatpfline(pd.date_range("2024-01-11", freq="D", periods=10))
+    )
+    assert not hasattr(pickle.loads(pickle.dumps(appended)), "_buffer")
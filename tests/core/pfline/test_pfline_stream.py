@@ -0,0 +1,82 @@
+"""Test creation of portfolio line from chunks of data."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+
+
+def get_df(freq: str = "15min", tz: str = "Europe/Berlin") -> pd.DataFrame:
+    i = pd.date_range("2024-01-01", "2024-07-01", freq=freq, inclusive="left", tz=tz)
+    values = np.random.rand(len(i), 2)
+    return pd.DataFrame({"w": values[:, 0], "p": values[:, 1] * 100}, i)
+
+
+def chunked(df: pd.DataFrame, size: int, keepfreq: bool = True):
+    for start in range(0, len(df), size):
+        chunk = df.iloc[start : start + size]
+        if not keepfreq:  # e.g. when reading from csv
+            chunk = chunk.set_axis(pd.DatetimeIndex(list(chunk.index)))
+        yield chunk
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["15min", "h", "D"])
+@pytest.mark.parametrize("keepfreq", [True, False])
+@pytest.mark.parametrize("periods", [None, 10])
+def test_fromchunks(freq: str, tz: str, keepfreq: bool, periods: int):
+    """Test if portfolio line from chunks equals portfolio line from all data."""
+    df = get_df(freq, tz)
+    chunks = chunked(df, 1000, keepfreq)
+    result = pf.PfLine.from_chunks(chunks, periods=periods)
+    assert result == pf.PfLine(df)
+    assert result.index.freq == df.index.freq
+
+
+@pytest.mark.parametrize("asfreq", ["D", "MS", "QS"])
+@pytest.mark.parametrize("size", [100, 5000, 100_000])
+def test_fromchunks_asfreq(asfreq: str, size: int):
+    """Test if values are correctly resampled while adding chunks."""
+    df = get_df()
+    result = pf.PfLine.from_chunks(chunked(df, size), asfreq=asfreq)
+    assert result == pf.PfLine(df).asfreq(asfreq)
+
+
+def test_fromchunks_asfreq_incompleteperiods():
+    """Test if incomplete periods at start and end are dropped."""
+    df = get_df("h").loc["2024-01-15":"2024-06-10"]
+    result = pf.PfLine.from_chunks(chunked(df, 1000), asfreq="MS")
+    assert result == pf.PfLine(df).asfreq("MS")
+    assert result.index[0] == pd.Timestamp("2024-02-01", tz="Europe/Berlin")
+
+
+def test_builder():
+    """Test if chunks can be added one by one."""
+    df = get_df("h")
+    builder = pf.PfLineBuilder()
+    builder.append(df.iloc[:100])
+    builder.append(df.iloc[100:200])
+    with pytest.raises(ValueError):
+        builder.pfline()  # no full days
+    builder.append(df.iloc[200:])
+    assert builder.pfline() == pf.PfLine(df)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        lambda df: [df.iloc[:100], df.iloc[101:]],  # gap
+        lambda df: [df.iloc[:100], df.iloc[99:]],  # overlap
+        lambda df: [df.iloc[:100], df.iloc[100:].tz_convert("Europe/London")],
+        lambda df: [df.iloc[:100], df.iloc[100:].drop(df.index[300])],
+        lambda df: [df.iloc[:100], pd.DataFrame({"w": df["w"].iloc[100:]})],  # kind
+        lambda df: [df.iloc[:100], df.iloc[100:].assign(w=0, q=1)],  # inconsistent
+        lambda df: [df.iloc[2:]],  # not at start of hour
+    ],
+)
+def test_fromchunks_error(chunks):
+    """Test if incorrect chunks are detected."""
+    df = get_df()
+    with pytest.raises(ValueError):
+        pf.PfLine.from_chunks(chunks(df))
@@ -12,3 +12,10 @@ def test_pfline_print(levels: int, kind: pf.Kind, flatten: bool):
     """Test if portfolio line can be printed."""
     pfl = pf.dev.get_pfline(kind=kind, nlevels=levels)
     pfl.print(flatten)
+
+
+def test_pfline_print_manychildren():
+    """Test if only the first few children are shown."""
+    pfl = pf.dev.get_pfline(nlevels=2, childcount=pf.core.pfline.text.MAX_CHILDREN + 3)
+    txt = repr(pfl)
+    assert "... (3 more; 13 in total)" in txt
@@ -0,0 +1,65 @@
+"""Test the validation levels when creating portfolio lines and states."""
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+
+INDEX = pd.date_range("2024", freq="D", periods=30, tz="Europe/Berlin")
+
+
+def inconsistent_data() -> pd.DataFrame:
+    """Data with values for w and q that do not match."""
+    return pd.DataFrame({"w": 1.0, "q": 100.0}, INDEX)
+
+
+def partialday_data() -> pd.DataFrame:
+    """Data with an index that does not contain full days."""
+    i = pd.date_range("2024-01-01 06:00", freq="h", periods=30, tz="Europe/Berlin")
+    return pd.DataFrame({"q": 1.0}, i)
+
+
+@pytest.mark.parametrize("level", ["full", "light", "trusted"])
+def test_inconsistent(monkeypatch, level: str):
+    """Test if inconsistent values are only rejected when fully validating."""
+    monkeypatch.setattr(pf.settings, "validation", level)
+    if level == "full":
+        with pytest.raises(ValueError):
+            pf.PfLine(inconsistent_data())
+    else:
+        pfl = pf.PfLine(inconsistent_data())
+        assert pfl.kind is pf.Kind.VOLUME
+
+
+@pytest.mark.parametrize("level", ["full", "light", "trusted"])
+def test_partialday(monkeypatch, level: str):
+    """Test if non-standardized index is only accepted when trusting the data."""
+    monkeypatch.setattr(pf.settings, "validation", level)
+    if level == "trusted":
+        pf.PfLine(partialday_data())
+    else:
+        with pytest.raises(ValueError):
+            pf.PfLine(partialday_data())
+
+
+def test_fromtrusted():
+    """Test if PfLine can be created from trusted data, regardless of setting."""
+    assert pf.settings.validation == "full"
+    pfl = pf.PfLine.from_trusted(inconsistent_data())
+    assert pfl.kind is pf.Kind.VOLUME
+    with pytest.raises(ValueError):
+        pf.PfLine(inconsistent_data())
+
+
+@pytest.mark.parametrize("kind", pf.Kind)
+def test_fromtrusted_sameresult(kind: pf.Kind):
+    """Test if PfLine from trusted data is equal to one from validated data."""
+    pfl = pf.dev.get_flatpfline(INDEX, kind)
+    assert pf.PfLine.from_trusted(pfl.df) == pf.PfLine(pfl.df)
+
+
+def test_invalidlevel(monkeypatch):
+    """Test if unknown validation level raises error."""
+    monkeypatch.setattr(pf.settings, "validation", "some")
+    with pytest.raises(ValueError):
+        pf.PfLine(inconsistent_data())
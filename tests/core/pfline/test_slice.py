@@ -185,3 +185,19 @@ def test__end_less_than_daily(enddate: str, tz: str):
     slice_end = f"{enddate[0]} 00:00"
     loc_end = f"{enddate[1]} 23:45"
     assert pfl1.slice[:slice_end] == pfl1.loc[:loc_end]
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["h", "15min"])
+@pytest.mark.parametrize(
+    "start,end",
+    [("2021-01-01 06:00", None), (None, "2021-01-01 06:00"), ("2022", "2022")],
+)
+def test__partial_or_empty(start: str, end: str, freq: str, tz: str):
+    """Test if slice with partial days, or without any timestamps, raises error."""
+    index = get_idx(
+        "2020", starttime="00:00", enddate="2024", freq=freq, inclusive="left", tz=tz
+    )
+    pfl1 = dev.get_flatpfline(index)
+    with pytest.raises(ValueError):
+        pfl1.slice[start:end]
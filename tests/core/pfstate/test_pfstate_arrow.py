@@ -0,0 +1,24 @@
+"""Test if portfolio state can be saved to and loaded from arrow and parquet formats."""
+
+import pytest
+
+import portfolyo as pf
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["15min", "h", "D", "MS"])
+def test_pfstate_arrow_roundtrip(freq: str, tz: str):
+    """Test if portfolio state is recreated from arrow table."""
+    pfs = pf.dev.get_pfstate(pf.dev.get_index(freq, tz, _seed=1), _seed=1)
+    result = pf.from_arrow(pfs.to_arrow())
+    assert isinstance(result, pf.PfState)
+    assert result == pfs
+
+
+def test_pfstate_parquet(tmp_path):
+    """Test if portfolio state is recreated from parquet file."""
+    pfs = pf.dev.get_pfstate()
+    pfs.to_parquet(tmp_path / "pfs.parquet")
+    assert pf.read_parquet(tmp_path / "pfs.parquet") == pfs
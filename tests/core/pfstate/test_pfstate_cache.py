@@ -0,0 +1,90 @@
+"""Test caching of derived portfolio lines on portfolio state."""
+
+import pandas as pd
+import pytest
+
+import portfolyo as pf
+
+DERIVED = ["unsourced", "netposition", "pnl_cost", "sourcedfraction"]
+
+
+@pytest.fixture
+def pfs():
+    i = pd.date_range("2024", freq="D", periods=60, tz="Europe/Berlin")
+    return pf.dev.get_pfstate(i)
+
+
+@pytest.mark.parametrize("name", DERIVED)
+def test_derived_is_cached(pfs, name):
+    """Test if derived value is only calculated once."""
+    assert getattr(pfs, name) is getattr(pfs, name)
+    assert name in pfs.cache_info()
+    assert pfs.cache_info()[name] > 0
+
+
+@pytest.mark.parametrize("name", DERIVED)
+def test_derived_clearcache(pfs, name):
+    """Test if cached value is removed, and recalculated to the same value."""
+    before = getattr(pfs, name)
+    pfs.clear_cache()
+    assert pfs.cache_info() == {}
+    after = getattr(pfs, name)
+    assert after is not before
+    if isinstance(before, pd.Series):
+        pf.testing.assert_series_equal(after, before)
+    else:
+        assert after == before
+
+
+def test_derived_optout(pfs, monkeypatch):
+    """Test if nothing is cached when caching is turned off."""
+    monkeypatch.setattr(pf.settings, "cache_derived", False)
+    for name in DERIVED:
+        getattr(pfs, name)
+    assert pfs.cache_info() == {}
+    assert pfs.unsourced is not pfs.unsourced
+
+
+def test_derived_notshared(pfs):
+    """Test if new instances do not reuse the cache of the original instance."""
+    pfs2 = pfs * 2
+    assert pfs2.unsourced == pfs.unsourced * 2
+
+
+@pytest.mark.parametrize("indexer", ["loc", "slice"])
+@pytest.mark.parametrize("name", DERIVED)
+def test_derived_sliced(pfs, indexer, name):
+    """Test if cached value is sliced along with the portfolio state, and equal to the
+    value calculated on the sliced state."""
+    getattr(pfs, name)
+    window = getattr(pfs, indexer)["2024-01-10":"2024-02-05"]
+    assert name in window.cache_info()
+    expected = getattr(
+        pf.PfState(window.offtake, window.unsourcedprice, window.sourced), name
+    )
+    if isinstance(expected, pd.Series):
+        pf.testing.assert_series_equal(getattr(window, name), expected)
+    else:
+        assert getattr(window, name) == expected
+
+
+@pytest.mark.parametrize("indexer", ["loc", "slice"])
+def test_slice_notrevalidated(pfs, indexer, monkeypatch):
+    """Test if slicing a portfolio state does not check its portfolio lines again."""
+
+    def fail(*args):
+        raise AssertionError("Should not be called.")
+
+    monkeypatch.setattr(pf.core.pfstate.pfstate.pfstate_helper, "make_pflines", fail)
+    window = getattr(pfs, indexer)["2024-01-10":"2024-02-05"]
+    assert window.index[0] == pd.Timestamp("2024-01-10", tz="Europe/Berlin")
+    assert window.unsourced == pfs.unsourced.loc[window.index]
+
+
+@pytest.mark.parametrize("name", DERIVED)
+def test_derived_iscached(pfs, name):
+    """Test if it can be determined whether a derived value is cached."""
+    assert not pf.core.shared.cache.is_cached(pfs, name)
+    getattr(pfs, name)
+    assert pf.core.shared.cache.is_cached(pfs, name)
+    assert not pf.core.shared.cache.is_cached(pfs, "offtakevolume")
@@ -0,0 +1,24 @@
+"""Test if portfolio state can be pickled and unpickled."""
+
+import pickle
+
+import pytest
+
+import portfolyo as pf
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["15min", "h", "D", "MS"])
+def test_pfstate_pickle_roundtrip(freq: str, tz: str):
+    """Test if portfolio state is recreated when unpickling."""
+    pfs = pf.dev.get_pfstate(pf.dev.get_index(freq, tz, _seed=1), _seed=1)
+    result = pickle.loads(pickle.dumps(pfs))
+    assert isinstance(result, pf.PfState)
+    assert result == pfs
+
+
+def test_pfstate_pickle_nocache():
+    """Test if cached derived values are not pickled."""
+    pfs = pf.dev.get_pfstate()
+    pfs.unsourced, pfs.pnl_cost
+    assert pickle.loads(pickle.dumps(pfs)).cache_info() == {}
@@ -1,5 +1,8 @@
 """Test if portfolio state can be printed."""
 
+import pandas as pd
+import pytest
+
 import portfolyo as pf
 
 
@@ -7,3 +10,14 @@ def test_pfstate_print():
     """Test if portfolio state can be printed."""
     pfs = pf.dev.get_pfstate()
     pfs.print()
+
+
+@pytest.mark.parametrize("freq", ["15min", "h", "D", "MS"])
+def test_pfstate_print_long(freq: str):
+    """Test if long portfolio state is printed the same, whether or not the pnl_cost
+    portfolio line has already been calculated."""
+    i = pd.date_range("2024", "2026", freq=freq, tz="Europe/Berlin", inclusive="left")
+    pfs = pf.dev.get_pfstate(i)
+    windowed = repr(pfs)
+    pfs.pnl_cost  # calculated on full index and cached
+    assert repr(pfs) == windowed
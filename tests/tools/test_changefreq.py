@@ -430,3 +430,18 @@ def test_index_new_freq(
     )
     result = tools.changefreq.index(index, freq[1])
     testing.assert_index_equal(result, expected_result)
+
+
+@pytest.mark.parametrize(
+    ("fn", "unit"),
+    [(tools.changefreq.averagable, "kW"), (tools.changefreq.summable, "kWh")],
+)
+@pytest.mark.parametrize("freq", ["15min", "MS"])
+def test_changefreq_keepsunit(fn: Callable, unit: str, freq: str):
+    """Test if resampling keeps the (non-default) unit and gives same result as
+    resampling the magnitudes."""
+    i = pd.date_range("2020", "2021", freq="D", tz="Europe/Berlin", inclusive="left")
+    s = pd.Series(np.random.random(len(i)), i)
+    result = fn(s.astype(f"pint[{unit}]"), freq)
+    assert result.pint.units == tools.unit.Unit(unit)
+    testing.assert_series_equal(result.pint.magnitude, fn(s, freq))
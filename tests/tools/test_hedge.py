@@ -146,3 +146,88 @@ def test_hedge_fromexcel(tz, freq, aggfreq, bpo, how, withunits):
 
     testing.assert_series_equal(p_result, p_expected, check_names=False)
     testing.assert_series_equal(w_result, w_expected, check_names=False)
+
+
+@pytest.mark.parametrize("withunits", ["units", "nounits"])
+@pytest.mark.parametrize("how", ["vol", "val"])
+@pytest.mark.parametrize("bpo", ["b", "po"])
+@pytest.mark.parametrize("freqs", [["YS", "QS", "MS"], ["MS", "YS"], ["QS", "D"]])
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("starttime", ["00:00", "06:00"])
+def test_hedge_cascade(tz, starttime, freqs, bpo, how, withunits):
+    """Test if cascade gives same result as successive hedges of the open volume."""
+    i = pd.date_range(
+        f"2020-01-01 {starttime}",
+        f"2021-02-01 {starttime}",
+        freq="h",
+        tz=tz,
+        inclusive="left",
+    )
+    win = pd.Series(np.random.uniform(10, 20, len(i)), i)
+    pin = pd.Series(np.random.uniform(50, 100, len(i)), i)
+    if withunits == "units":
+        win = win.astype("pint[MW]")
+        pin = pin.astype("pint[Eur/MWh]")
+    peak_fn = tools.product.germanpower_peakfn if bpo == "po" else None
+
+    result = tools.hedge.cascade(win, pin, freqs, how, peak_fn)
+
+    assert list(result.keys()) == freqs
+    w_open = win
+    for freq in freqs:
+        layer_peak_fn = None if freq == "D" else peak_fn
+        w_expected, p_expected = tools.hedge.hedge(
+            w_open, pin, how, layer_peak_fn, freq
+        )
+        w_result, p_result = result[freq]
+        testing.assert_series_equal(w_result, w_expected, check_names=False)
+        testing.assert_series_equal(p_result, p_expected, check_names=False)
+        w_open = w_open - w_result.reindex(i, fill_value=0)
+
+
+@pytest.mark.parametrize("how", ["vol", "val"])
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("freq", ["D", "MS", "QS"])
+def test_hedge_startofday(tz, freq, how):
+    """Test if delivery periods of the hedge start at the start-of-day."""
+    i = pd.date_range(
+        "2020-01-01 06:00", "2021-01-01 06:00", freq="h", tz=tz, inclusive="left"
+    )
+    win = pd.Series(np.random.uniform(10, 20, len(i)), i)
+    pin = pd.Series(np.random.uniform(50, 100, len(i)), i)
+
+    w_result, p_result = tools.hedge.hedge(win, pin, how, None, freq)
+
+    for period_start in pd.date_range(i[0], i[-1], freq=freq):
+        period_end = tools.right.stamp(period_start, freq)
+        rows = (i >= period_start) & (i < period_end)
+        df = pd.DataFrame({"w": win[rows], "p": pin[rows]})
+        df["duration"] = tools.duration.index(df.index)
+        expected = tools.hedge.one_hedge(df, how)
+        assert np.allclose(w_result[rows], expected["w"])
+        assert np.allclose(p_result[rows], expected["p"])
+
+
+@pytest.mark.parametrize("how", ["vol", "val"])
+def test_hedge_nanprice(how):
+    """Test if cascade and hedge handle a missing price in the same way."""
+    i = pd.date_range("2020-01-01", "2020-04-01", freq="D", inclusive="left")
+    win = pd.Series(10.0, i)
+    pin = pd.Series(60.0, i)
+    pin.iloc[5] = np.nan
+
+    w_expected, p_expected = tools.hedge.hedge(win, pin, how, None, "MS")
+    w_result, p_result = tools.hedge.cascade(win, pin, ["MS"], how)["MS"]
+
+    assert p_expected.iloc[0] == p_result.iloc[0] == 60.0
+    testing.assert_series_equal(w_result, w_expected, check_names=False)
+    testing.assert_series_equal(p_result, p_expected, check_names=False)
+
+
+def test_hedge_cascade_duplicatefreqs():
+    """Test if error is raised when a product frequency is passed twice."""
+    i = pd.date_range("2020-01-01", "2021-01-01", freq="h", inclusive="left")
+    win = pd.Series(np.random.uniform(10, 20, len(i)), i)
+    pin = pd.Series(np.random.uniform(50, 100, len(i)), i)
+    with pytest.raises(ValueError):
+        tools.hedge.cascade(win, pin, ["MS", "QS", "MS"])
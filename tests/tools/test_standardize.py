@@ -208,3 +208,53 @@ def test_standardize_gaps(freq, in_tz, remove, series_or_df):
 
     result = tools.standardize.frame(fr, force, tz=out_tz)
     assert result.index.freq == freq
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin", "Asia/Kolkata"])
+@pytest.mark.parametrize("freq", TEST_FREQUENCIES)
+@pytest.mark.parametrize("starttime", ["00:00", "06:00"])
+def test_assert_index_standardized(freq: str, tz: str, starttime: str):
+    """Test if standardized index passes, also when checked a second time."""
+    i = pd.date_range(
+        f"2020-01-01 {starttime}",
+        f"2022-01-01 {starttime}",
+        freq=freq,
+        tz=tz,
+        inclusive="left",
+    )
+    tools.standardize.assert_index_standardized(i)
+    tools.standardize.assert_index_standardized(i)
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin", "Asia/Kolkata"])
+@pytest.mark.parametrize("freq", TEST_FREQUENCIES)
+@pytest.mark.parametrize("starttime", ["00:30", "06:10"])
+def test_assert_index_standardized_wrongtime(freq: str, tz: str, starttime: str):
+    """Test if index starting at wrong time is not standardized."""
+    i = pd.date_range(
+        f"2020-01-01 {starttime}",
+        f"2022-01-01 {starttime}",
+        freq=freq,
+        tz=tz,
+        inclusive="left",
+    )
+    with pytest.raises(AssertionError):
+        tools.standardize.assert_index_standardized(i)
+
+
+def test_assert_index_standardized_derived(monkeypatch):
+    """Test if index of a calculated portfolio line is not checked again, but an equal
+    index that is a distinct object is."""
+    i = pd.date_range(
+        "2020", "2022", freq="15min", tz="Europe/Berlin", inclusive="left"
+    )
+    pfl = dev.get_flatpfline(i)
+    derived = (pfl.slice["2021":] * 2).asfreq("h")
+
+    def fail(*args):
+        raise AssertionError("Index is checked.")
+
+    monkeypatch.setattr(tools.standardize, "_walltime", fail)
+    tools.standardize.assert_frame_standardized(derived.df["w"])
+    with pytest.raises(AssertionError):
+        tools.standardize.assert_index_standardized(derived.index.copy(deep=True))
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from portfolyo import tools
@@ -71,3 +72,49 @@ QUANTITY_IDENTITIES = [
 def test_extended_identities(quants):
     for q in quants:
         assert np.isclose(q, quants[0])
+
+
+@pytest.mark.parametrize("unit", [None, "kW"])
+def test_convert_quantities(unit):
+    """Test if quantities in mixed units are converted correctly."""
+    values = np.array(
+        [Q_(1.0, "MW"), Q_(2.0, "kW"), Q_(3.0, "MW"), Q_(4.0, "GW")], dtype=object
+    )
+    magnitudes, units = tools.unit.convert_quantities(values, unit)
+    expected = [Q_(v).to(unit or Q_(v).to_base_units().units).m for v in values]
+    np.testing.assert_allclose(magnitudes, expected)
+    assert units == [ureg.Unit("MW") if unit is None else ureg.Unit(unit)]
+
+
+def test_convert_quantities_dimensionalityerror():
+    """Test if error is raised for quantities of different dimensions."""
+    values = np.array([Q_(1.0, "MW"), Q_(2.0, "MWh")], dtype=object)
+    with pytest.raises(tools.unit.pint.DimensionalityError):
+        _ = tools.unit.convert_quantities(values, ureg.Unit("MW"))
+
+
+@pytest.mark.parametrize(
+    ("unit_from", "unit_to", "expected"),
+    [
+        ("MW", "kW", 1000.0),
+        ("GWh", "MWh", 1000.0),
+        ("Eur/MWh", "ct/kWh", 0.1),
+        ("kEur", "Eur", 1000.0),
+        ("min", "h", 1 / 60),
+    ],
+)
+def test_factor(unit_from, unit_to, expected):
+    """Test if conversion factors are correct."""
+    result = tools.unit.factor(ureg.Unit(unit_from), ureg.Unit(unit_to))
+    assert np.isclose(result, expected)
+
+
+def test_convert():
+    """Test if series is converted correctly, and data type is reused."""
+    s = pd.Series([1.0, 2.5, -3.0], dtype="pint[kW]", name="w")
+    result = tools.unit.convert(s, ureg.MW)
+    expected = pd.Series([0.001, 0.0025, -0.003], dtype="pint[MW]", name="w")
+    pd.testing.assert_series_equal(result, expected)
+    assert result.dtype is tools.unit.pinttype(ureg.MW)
+    with pytest.raises(tools.unit.pint.DimensionalityError):
+        _ = tools.unit.convert(s, ureg.MWh)
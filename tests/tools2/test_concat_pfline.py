@@ -1,5 +1,6 @@
 """Test if concatenation of PfLines works properly with different test cases."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -153,3 +154,26 @@ def test_concat_three_nestedpflines(
     result2 = fn([pfl_b, pfl_c, pfl_a])
     assert whole_pfl == result
     assert whole_pfl == result2
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_concat_many_pflines(tz: str, levels: int):
+    """Test that many pflines, in random order, get concatenated properly."""
+    idx = pd.date_range("2022-01-01", "2022-03-01", freq="h", inclusive="left", tz=tz)
+    whole_pfl = dev.get_pfline(idx, nlevels=levels, childcount=2)
+    days = pd.date_range("2022-01-01", "2022-03-01", freq="D", tz=tz)
+    pfls = [whole_pfl.slice[a:b] for a, b in zip(days[:-1], days[1:])]
+    pfls = [pfls[i] for i in np.random.permutation(len(pfls))]
+    result = concat.concat_pflines(pfls)
+    assert whole_pfl == result
+    assert result.index.freq == whole_pfl.index.freq
+
+
+def test_concat_pflines_gap():
+    """Test that a gap between many pflines is found."""
+    idx = pd.date_range("2022-01-01", "2022-03-01", freq="D", inclusive="left")
+    whole_pfl = dev.get_flatpfline(idx)
+    pfls = [whole_pfl.slice[a:b] for a, b in zip(idx[:-1:7], idx[7::7])]
+    with pytest.raises(ValueError):
+        concat.concat_pflines(pfls[:3] + pfls[4:])